@@ -243,12 +243,21 @@ class StockDatabase:
         """Save macro data observations to database"""
         return self.macro.save_macro_data(data_type, series_id, observations)
 
+    def upsert_macro_series(self, data_type: str, series_id: str,
+                            dates: List[str], values: List[float]) -> int:
+        """Insert or update a macro series given as parallel date and value lists"""
+        return self.macro.upsert_macro_series(data_type, series_id, dates, values)
+
     def get_macro_data(self, data_type: str, series_id: str,
                        start_date: Optional[str] = None,
                        end_date: Optional[str] = None) -> pd.DataFrame:
         """Get macro data from database"""
         return self.macro.get_macro_data(data_type, series_id, start_date, end_date)
 
+    def get_macro_last_updated(self, data_type: str, series_id: str) -> Optional[str]:
+        """Get when a macro series was last written to the cache"""
+        return self.macro.get_macro_last_updated(data_type, series_id)
+
     def get_latest_macro_snapshot(self) -> Dict:
         """Get latest macro data snapshot for quick dashboard loading"""
         return self.macro.get_latest_macro_snapshot()
@@ -2,6 +2,7 @@
 Macro repository - Macroeconomic data persistence
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional
 from datetime import datetime
@@ -56,6 +57,45 @@ class MacroRepository:
             print(f"Error saving macro data: {str(e)}")
             return 0
 
+    def upsert_macro_series(self, data_type: str, series_id: str,
+                            dates: List[str], values: List[float]) -> int:
+        """
+        Insert or update a macro series given as parallel date and value lists
+
+        Existing rows are updated in place rather than deleted and re-inserted,
+        and the whole series is written in one executemany batch, which keeps
+        incremental refreshes of a few recent observations cheap.
+
+        Args:
+            data_type: Type of data (fx_rate, gold, yield, credit_spread)
+            series_id: FRED series ID
+            dates: Observation dates (YYYY-MM-DD)
+            values: Observation values, one per date
+
+        Returns:
+            Number of records saved
+        """
+        try:
+            now = datetime.now()
+            self.conn.executemany('''
+                INSERT INTO macro_data (
+                    data_type, series_id, date, value, last_updated
+                ) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(data_type, series_id, date) DO UPDATE SET
+                    value = excluded.value,
+                    last_updated = excluded.last_updated
+            ''', [
+                (data_type, series_id, date, value, now)
+                for date, value in zip(dates, values)
+            ])
+
+            self.conn.commit()
+            return len(dates)
+
+        except Exception as e:
+            print(f"Error upserting macro data: {str(e)}")
+            return 0
+
     def get_macro_data(self, data_type: str, series_id: str,
                        start_date: Optional[str] = None,
                        end_date: Optional[str] = None) -> pd.DataFrame:
@@ -87,10 +127,37 @@ class MacroRepository:
 
         query += ' ORDER BY date'
 
-        df = pd.read_sql_query(query, self.conn, params=params)
-        if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
-        return df
+        # Build the frame column-wise from the raw rows: avoids the
+        # read_sql_query overhead and date format inference, since cached
+        # dates are always stored as YYYY-MM-DD
+        rows = self.conn.execute(query, params).fetchall()
+        if not rows:
+            return pd.DataFrame(columns=['date', 'value'])
+
+        dates, values = zip(*rows)
+        return pd.DataFrame({
+            'date': pd.to_datetime(dates, format='%Y-%m-%d'),
+            'value': np.array(values, dtype=np.float64)
+        })
+
+    def get_macro_last_updated(self, data_type: str, series_id: str) -> Optional[str]:
+        """
+        Get when a macro series was last written to the database
+
+        Args:
+            data_type: Type of data
+            series_id: FRED series ID
+
+        Returns:
+            Latest last_updated timestamp as string, or None if not cached
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT MAX(last_updated) AS last_updated FROM macro_data
+            WHERE data_type = ? AND series_id = ?
+        ''', (data_type, series_id))
+        row = cursor.fetchone()
+        return row['last_updated'] if row else None
 
     def get_latest_macro_snapshot(self) -> Dict:
         """
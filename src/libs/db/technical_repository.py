@@ -81,7 +81,7 @@ class TechnicalRepository:
 
         # Sort by date ascending for analysis
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
+            df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d')
             df = df.sort_values('date', ascending=True)
 
         return df
@@ -21,7 +21,7 @@ class GrowthAnalyzer:
         """
         self.df = pd.DataFrame(financial_history)
         if not self.df.empty:
-            self.df['period_end_date'] = pd.to_datetime(self.df['period_end_date'])
+            self.df['period_end_date'] = pd.to_datetime(self.df['period_end_date'], format='%Y-%m-%d')
             self.df = self.df.sort_values('period_end_date')
 
     def calculate_cagr(self, metric: str, years: int) -> Optional[float]:
@@ -9,19 +9,117 @@ For spread calculations, see also: libs/spread_calculator.py (SpreadCalculator)
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
+import threading
 import yfinance as yf
 
 logger = logging.getLogger(__name__)
 
 
+def _to_date_strs(dates) -> List[str]:
+    """Format a datetime column or array as YYYY-MM-DD strings for chart histories"""
+    return np.datetime_as_string(np.asarray(dates).astype('datetime64[D]'), unit='D').tolist()
+
+
+def _history_dict(df: pd.DataFrame, decimals: int, column: str = 'value') -> Dict[str, List]:
+    """Chart history of a (date, value) frame: YYYY-MM-DD dates and rounded values"""
+    return {
+        'dates': _to_date_strs(df['date']),
+        'values': np.round(df[column].to_numpy(), decimals).tolist()
+    }
+
+
+def _latest_with_yoy(df: pd.DataFrame, decimals: int) -> Dict:
+    """Latest value, change vs. 12 observations earlier (%) and chart history of a monthly series"""
+    values = df['value'].to_numpy()
+    current = values[-1]
+
+    yoy_change = None
+    if len(values) >= 13:
+        year_ago = values[-13]
+        yoy_change = round(((current - year_ago) / year_ago) * 100, 1)
+
+    return {
+        'current': round(current, decimals),
+        'yoy_change': yoy_change,
+        'history': _history_dict(df, decimals),
+    }
+
+
+def _yoy_pct(values: np.ndarray, periods: int = 12) -> np.ndarray:
+    """Percent change of each observation vs. `periods` observations earlier (first `periods` dropped)"""
+    return (values[periods:] / values[:-periods] - 1) * 100
+
+
+def _last_per_year(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Last observation of each calendar year of a date-sorted (date, value) frame"""
+    years = df['date'].dt.year.to_numpy()
+    is_last = np.append(years[1:] != years[:-1], True)
+    return pd.DataFrame({'year': years[is_last], column: df['value'].to_numpy()[is_last]})
+
+
+def _close_frame(close: pd.Series) -> pd.DataFrame:
+    """(date, value) frame of a Yahoo Finance Close column, timezone-naive like FRED dates"""
+    dates = close.index if close.index.tz is None else close.index.tz_localize(None)
+    df = pd.DataFrame({'date': dates, 'value': close.to_numpy(dtype=np.float64)})
+    # Yahoo returns bars in ascending order; only sort if that ever changes
+    if not dates.is_monotonic_increasing:
+        df = df.sort_values('date', ignore_index=True)
+    return df
+
+
+def _percentile_rank(values, current: float) -> float:
+    """Percentage of observations (Series or array) at or below the current value"""
+    return np.mean(np.asarray(values) <= current) * 100
+
+
+def _historical_spreads(dates_long: np.ndarray, values_long: np.ndarray,
+                        dates_short: np.ndarray, values_short: np.ndarray,
+                        days_back: np.ndarray) -> np.ndarray:
+    """
+    Spread between two sorted series at several lookbacks from the long series' last date
+
+    Each side uses its last observation on or before the target date.
+
+    Args:
+        dates_long, values_long: Dates and values of the longer maturity
+        dates_short, values_short: Dates and values of the shorter maturity
+        days_back: Lookbacks in days
+
+    Returns:
+        Array of spreads, one per lookback (NaN where either series has no data yet)
+    """
+    targets = dates_long[-1] - days_back.astype('timedelta64[D]')
+    idx_long = np.searchsorted(dates_long, targets, side='right') - 1
+    idx_short = np.searchsorted(dates_short, targets, side='right') - 1
+
+    spreads = values_long[idx_long] - values_short[idx_short]
+    spreads[(idx_long < 0) | (idx_short < 0)] = np.nan
+    return spreads
+
+
+# Lookbacks (days) reported for each yield spread, and the summary keys
+# in output order: current value, value at each lookback, change since each
+_SPREAD_LOOKBACK_DAYS = (30, 90, 180, 365)
+_SPREAD_SUMMARY_KEYS = (
+    'current',
+    '1m_ago', '3m_ago', '6m_ago', '1y_ago',
+    'change_1m', 'change_3m', 'change_6m', 'change_1y',
+)
+
+
 class MacroDataFetcher:
     """Fetches macro data from FRED API"""
 
     FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
+    FRED_SERIES_URL = "https://api.stlouisfed.org/fred/series"
 
     # FRED Series IDs
     CURRENCY_SERIES = {
@@ -92,6 +190,60 @@ class MacroDataFetcher:
         'fed_assets': 'WALCL',          # Fed Total Assets (Balance Sheet)
     }
 
+    # Cache TTL per data type, in hours. Cache age is measured from the latest
+    # observation date, so each TTL must stay below the shortest gap between an
+    # observation date and the release of the next observation, or that release
+    # is hidden until the TTL runs out. Past the TTL, the FRED metadata check
+    # keeps revalidation cheap. Types not listed (daily market series) use cache_hours.
+    DATA_TYPE_TTL_HOURS = {
+        'mortgage': 24 * 6,             # weekly, next release 7 days after the observation date
+        'fed_assets': 24 * 6,           # weekly, next release 8 days after the observation date
+        'inflation': 24 * 60,           # monthly
+        'money_supply': 24 * 60,        # monthly (M2) / quarterly (velocity)
+        'housing_price': 24 * 60,       # monthly (Case-Shiller) / quarterly (median price)
+        'housing_activity': 24 * 60,    # monthly
+        'housing_inventory': 24 * 60,   # monthly
+        'affordability': 24 * 60,       # monthly / quarterly / annual
+        'gdp': 24 * 150,                # quarterly
+        'debt': 24 * 150,               # quarterly
+        'buffett_indicator': 24 * 400,  # annual
+    }
+
+    # Max number of DataFrames kept in the per-instance memory cache (large
+    # enough for every macro page's series when the fetcher is shared)
+    MEMORY_CACHE_SIZE = 96
+
+    # Days re-requested before the latest cached observation on incremental
+    # fetches, so that revisions of already cached observations reach the cache.
+    # Daily series only revise the last few days. Lower-frequency releases revise
+    # several past observations (housing starts and permits the prior two months,
+    # PCE several months, GDP past quarters, annual benchmark revisions), so
+    # they re-request about a year: still only a handful of rows.
+    INCREMENTAL_OVERLAP_DAYS = 3
+    DATA_TYPE_OVERLAP_DAYS = {
+        'mortgage': 35,                 # weekly
+        'fed_assets': 35,               # weekly
+        'inflation': 400,               # monthly
+        'money_supply': 400,            # monthly / quarterly
+        'housing_price': 400,           # monthly / quarterly
+        'housing_activity': 400,        # monthly
+        'housing_inventory': 400,       # monthly
+        'affordability': 400,           # monthly / quarterly / annual
+        'gdp': 400,                     # quarterly
+        'debt': 400,                    # quarterly
+        'buffett_indicator': 400,       # annual
+    }
+
+    # Max concurrent FRED requests issued by fetch_many()
+    FETCH_WORKERS = 8
+
+    # Retries for FRED requests failing with a rate limit or server error,
+    # with exponential backoff between attempts (or the server's Retry-After
+    # delay on 429): concurrent fetches make rate limiting bursts likely
+    FRED_MAX_RETRIES = 5
+    FRED_RETRY_BACKOFF = 0.5
+    FRED_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
     def __init__(self, fred_api_key: str, db=None, cache_hours: int = 24):
         """
         Initialize with FRED API key and optional database for caching
@@ -104,166 +256,305 @@ class MacroDataFetcher:
         self.api_key = fred_api_key
         self.db = db
         self.cache_hours = cache_hours
+        self._cache_ttl = pd.Timedelta(hours=cache_hours)
+
+        # In-memory cache of fetched series keyed by (series_id, start_date, end_date).
+        # Cached DataFrames are shared between callers and must be treated as read-only.
+        # Values stay float64: float32 would not survive the 2-decimal rounding of the
+        # API output (0.32 -> 0.3199999928) and its scalars are not JSON serializable.
+        self._mem_cache: Dict[Tuple[str, Optional[str], Optional[str]], pd.DataFrame] = {}
+
+        # Reference time for cache freshness checks, computed once per refresh,
+        # and the values derived from it: staleness threshold per data type and
+        # lookback window start date per number of days
+        self._now_cached: Optional[pd.Timestamp] = None
+        self._stale_before: Dict[str, pd.Timestamp] = {}
+        self._start_dates: Dict[int, str] = {}
+
+        # fetch_many() runs _fetch_series on worker threads: serialize access
+        # to the memory cache and to the shared SQLite connection
+        self._mem_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+        # One lock per series: concurrent cache misses for the same series
+        # (e.g. two panels refreshing gold at once) download it only once
+        self._series_locks: Dict[str, threading.Lock] = {}
+
+        # Keep-alive HTTP session for FRED: consecutive (and concurrent) requests
+        # reuse pooled connections instead of a new TCP/TLS handshake each, and
+        # transient failures are retried before a series is given up on
+        self._http = requests.Session()
+        retry = Retry(
+            total=self.FRED_MAX_RETRIES,
+            backoff_factor=self.FRED_RETRY_BACKOFF,
+            status_forcelist=self.FRED_RETRY_STATUSES,
+            allowed_methods=frozenset({'GET'}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.FETCH_WORKERS, max_retries=retry)
+        self._http.mount('https://', adapter)
+
+    def invalidate_memory_cache(self):
+        """Clear the in-memory series cache and freshness clock (e.g. between two full refreshes)"""
+        with self._mem_lock:
+            self._mem_cache.clear()
+            self._now_cached = None
+            self._stale_before.clear()
+            self._start_dates.clear()
+
+    def _current_time(self) -> pd.Timestamp:
+        """
+        Get the reference time used for cache freshness checks and lookback windows
+
+        Computed lazily and reused until invalidate_memory_cache() is called.
+        """
+        if self._now_cached is None:
+            self._now_cached = pd.Timestamp.now()
+        return self._now_cached
+
+    def _start_date(self, lookback_days: int) -> str:
+        """Get the start date (YYYY-MM-DD) of a lookback window ending at the reference time"""
+        start_date = self._start_dates.get(lookback_days)
+        if start_date is None:
+            start_date = (self._current_time() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+            self._start_dates[lookback_days] = start_date
+        return start_date
+
+    def _stale_threshold(self, data_type: str) -> pd.Timestamp:
+        """Get the date before which cached data of this type is considered stale"""
+        threshold = self._stale_before.get(data_type)
+        if threshold is None:
+            ttl_hours = self.DATA_TYPE_TTL_HOURS.get(data_type)
+            ttl = self._cache_ttl if ttl_hours is None else pd.Timedelta(hours=ttl_hours)
+            threshold = self._current_time() - ttl
+            self._stale_before[data_type] = threshold
+        return threshold
+
+    def _cache_age_hours(self, latest_date: pd.Timestamp) -> float:
+        """Get the age of a cached series' latest observation in hours, for logging"""
+        return (self._current_time() - latest_date) / pd.Timedelta(hours=1)
+
+    def _series_lock(self, series_id: str) -> threading.Lock:
+        """Get the lock serializing cache misses for one series"""
+        with self._mem_lock:
+            return self._series_locks.setdefault(series_id, threading.Lock())
+
+    def _overlap_start(self, series_id: str, cached_df: pd.DataFrame,
+                       start_date: Optional[str]) -> pd.Timestamp:
+        """
+        Get the date an incremental fetch restarts from
 
-    def _get_cached_series(self, series_id: str, start_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+        Args:
+            series_id: Series identifier
+            cached_df: Cached DataFrame the fetched observations are merged into
+            start_date: Start date of the requested window (YYYY-MM-DD), if any
+
+        Returns:
+            Latest cached date minus the data type's overlap, not before start_date
+        """
+        overlap_days = self.DATA_TYPE_OVERLAP_DAYS.get(_series_to_data_type(series_id),
+                                                       self.INCREMENTAL_OVERLAP_DAYS)
+        overlap_start = cached_df['date'].iat[-1] - pd.Timedelta(days=overlap_days)
+        if start_date is not None:
+            overlap_start = max(overlap_start, pd.Timestamp(start_date))
+        return overlap_start
+
+    def _recall_series(self, key: Tuple[str, Optional[str], Optional[str]]) -> Optional[pd.DataFrame]:
+        """Look up a series in the memory cache, marking it as most recently used"""
+        with self._mem_lock:
+            df = self._mem_cache.pop(key, None)
+            if df is not None:
+                self._mem_cache[key] = df
+            return df
+
+    def _remember_series(self, key: Tuple[str, Optional[str], Optional[str]], df: pd.DataFrame):
+        """Store a fetched series in the memory cache, evicting the least recently used entry when full"""
+        if df.empty:
+            return
+        with self._mem_lock:
+            self._mem_cache.pop(key, None)
+            if len(self._mem_cache) >= self.MEMORY_CACHE_SIZE:
+                self._mem_cache.pop(next(iter(self._mem_cache)))
+            self._mem_cache[key] = df
+
+    def _slice_remembered_series(self, series_id: str,
+                                 start_date: Optional[str]) -> Optional[pd.DataFrame]:
         """
-        Try to get series data from database cache
+        Serve a series window from a wider window already in the memory cache
+
+        E.g. the 90-day yield curve lookup can reuse the 20-year spread
+        history of the same Treasury series, and the 2-year S&P 500 moving
+        averages can reuse the 5-year returns window.
+
+        Args:
+            series_id: Series identifier
+            start_date: Start date in YYYY-MM-DD format
 
         Returns:
-            DataFrame if cache is fresh, None if cache miss or stale
+            DataFrame sliced from start_date, None if no cached window covers it
+        """
+        with self._mem_lock:
+            entries = list(self._mem_cache.items())
+
+        for (cached_id, cached_start, cached_end), df in entries:
+            if cached_id != series_id or cached_end is not None:
+                continue
+            if cached_start is None or (start_date is not None and cached_start <= start_date):
+                if start_date is None:
+                    return df
+                return df[df['date'] >= pd.Timestamp(start_date)].reset_index(drop=True)
+        return None
+
+    def _fred_series_unchanged(self, series_id: str, data_type: str) -> bool:
+        """
+        Check FRED series metadata to see whether a cached series is still current
+
+        Much cheaper than re-downloading the observations: the metadata
+        response is a few hundred bytes.
+
+        Args:
+            series_id: FRED series identifier
+            data_type: Cache data type of the series
+
+        Returns:
+            True if FRED has not updated the series since it was cached
+        """
+        try:
+            with self._db_lock:
+                cached_at = self.db.get_macro_last_updated(data_type, series_id)
+        except Exception as e:
+            logger.error(f"Error reading cache for {series_id}: {e}")
+            return False
+        if not cached_at:
+            return False
+
+        params = {
+            'series_id': series_id,
+            'api_key': self.api_key,
+            'file_type': 'json',
+        }
+
+        try:
+            response = self._http.get(self.FRED_SERIES_URL, params=params, timeout=5)
+            response.raise_for_status()
+            last_updated = pd.Timestamp(response.json()['seriess'][0]['last_updated'])
+        except (requests.exceptions.RequestException, ValueError, KeyError, IndexError) as e:
+            logger.warning(f"Could not check FRED metadata for {series_id}: {e}")
+            return False
+
+        # last_updated carries a UTC offset; cache timestamps are naive local time
+        return last_updated <= pd.Timestamp(cached_at).to_pydatetime().astimezone()
+
+    def _read_cached_series(self, series_id: str,
+                            start_date: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Read series data from database cache, regardless of freshness
+
+        Args:
+            series_id: Series identifier
+            start_date: Start date in YYYY-MM-DD format
+
+        Returns:
+            DataFrame if the cache covers the requested window, None otherwise
         """
         if not self.db:
             return None
 
         try:
-            # Determine data type based on series_id
-            if series_id in self.CURRENCY_SERIES.values():
-                data_type = 'fx_rate'
-            elif series_id in self.TREASURY_SERIES.values():
-                data_type = 'yield'
-            elif series_id in self.CREDIT_SPREAD_SERIES.values():
-                data_type = 'credit_spread'
-            elif series_id == 'GC=F':
-                data_type = 'gold'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('buffett_indicator')]:
-                data_type = 'buffett_indicator'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('gdp')]:
-                data_type = 'gdp'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('m2'), self.GLOBAL_ECONOMY_SERIES.get('m2_velocity')]:
-                data_type = 'money_supply'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('debt_gdp'), self.GLOBAL_ECONOMY_SERIES.get('debt_public_gdp')]:
-                data_type = 'debt'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('case_shiller_national'),
-                              self.REAL_ESTATE_SERIES.get('case_shiller_20city'),
-                              self.REAL_ESTATE_SERIES.get('median_home_price')]:
-                data_type = 'housing_price'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('housing_starts'),
-                              self.REAL_ESTATE_SERIES.get('building_permits'),
-                              self.REAL_ESTATE_SERIES.get('existing_home_sales')]:
-                data_type = 'housing_activity'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('housing_inventory'),
-                              self.REAL_ESTATE_SERIES.get('months_supply'),
-                              self.REAL_ESTATE_SERIES.get('new_home_months_supply')]:
-                data_type = 'housing_inventory'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('mortgage_30y')]:
-                data_type = 'mortgage'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('affordability_index'),
-                              self.REAL_ESTATE_SERIES.get('median_income'),
-                              self.REAL_ESTATE_SERIES.get('mortgage_debt_service')]:
-                data_type = 'affordability'
-            elif series_id in [self.INFLATION_SERIES.get('cpi'),
-                              self.INFLATION_SERIES.get('core_cpi'),
-                              self.INFLATION_SERIES.get('pce'),
-                              self.INFLATION_SERIES.get('core_pce')]:
-                data_type = 'inflation'
-            elif series_id in [self.INFLATION_SERIES.get('breakeven_5y'),
-                              self.INFLATION_SERIES.get('breakeven_10y')]:
-                data_type = 'breakeven'
-            elif series_id in [self.INFLATION_SERIES.get('fed_funds')]:
-                data_type = 'fed_funds'
-            elif series_id in [self.INFLATION_SERIES.get('fed_assets')]:
-                data_type = 'fed_assets'
-            elif series_id in ['^VIX', '^VIX3M']:
-                data_type = 'vix'
-            else:
+            data_type = _series_to_data_type(series_id)
+            if data_type is None:
                 return None
 
-            # Check if we have recent data
-            df = self.db.get_macro_data(data_type, series_id, start_date=start_date)
+            with self._db_lock:
+                df = self.db.get_macro_data(data_type, series_id, start_date=start_date)
 
             if df.empty:
                 return None
 
-            # Check if cache is fresh (has data from last cache_hours)
-            latest_date = pd.to_datetime(df['date'].max())
-            cache_age = datetime.now() - latest_date.replace(tzinfo=None)
-
-            # Also check if cache covers the requested start_date
+            # Check if cache covers the requested start_date (rows come back
+            # ordered by date, so the bounds are the first/last rows)
             if start_date:
-                earliest_date = pd.to_datetime(df['date'].min())
-                requested_start = pd.to_datetime(start_date)
+                earliest_date = df['date'].iat[0]
+                requested_start = pd.Timestamp(start_date)
                 # Allow 30 days tolerance for data that may not be available at exact start
                 if earliest_date > requested_start + pd.Timedelta(days=30):
-                    logger.info(f"Cache incomplete for {series_id}: earliest={earliest_date.date()}, requested={requested_start.date()}")
+                    logger.info("Cache incomplete for %s: earliest=%s, requested=%s",
+                                series_id, earliest_date.date(), requested_start.date())
                     return None
 
-            if cache_age.total_seconds() / 3600 <= self.cache_hours:
-                logger.info(f"Using cached data for {series_id} (age: {cache_age.total_seconds()/3600:.1f}h)")
-                return df
-            else:
-                logger.info(f"Cache stale for {series_id} (age: {cache_age.total_seconds()/3600:.1f}h)")
-                return None
+            return df
 
         except Exception as e:
             logger.error(f"Error reading cache for {series_id}: {e}")
             return None
 
+    def _is_cache_fresh(self, series_id: str, df: pd.DataFrame,
+                        check_fred_updates: bool = False) -> bool:
+        """
+        Check whether cached series data is recent enough to use
+
+        Args:
+            series_id: Series identifier
+            df: Cached DataFrame as returned by _read_cached_series
+            check_fred_updates: When the cache is stale, ask FRED whether the
+                series actually changed and keep using the cache if not
+
+        Returns:
+            True if the cached data can be used as-is
+        """
+        data_type = _series_to_data_type(series_id)
+        latest_date = df['date'].iat[-1]
+
+        # Fresh if the latest observation is within the data type's TTL
+        if latest_date >= self._stale_threshold(data_type):
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Using cached data for %s (age: %.1fh)", series_id, self._cache_age_hours(latest_date))
+            return True
+        elif check_fred_updates and self._fred_series_unchanged(series_id, data_type):
+            logger.info("Using cached data for %s (unchanged on FRED)", series_id)
+            return True
+        else:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Cache stale for %s (age: %.1fh)", series_id, self._cache_age_hours(latest_date))
+            return False
+
+    def _get_cached_series(self, series_id: str, start_date: Optional[str] = None,
+                           check_fred_updates: bool = False) -> Optional[pd.DataFrame]:
+        """
+        Try to get series data from database cache
+
+        Args:
+            series_id: Series identifier
+            start_date: Start date in YYYY-MM-DD format
+            check_fred_updates: When the cache is stale, ask FRED whether the
+                series actually changed and keep using the cache if not
+
+        Returns:
+            DataFrame if cache is fresh, None if cache miss or stale
+        """
+        df = self._read_cached_series(series_id, start_date)
+        if df is not None and self._is_cache_fresh(series_id, df, check_fred_updates):
+            return df
+        return None
+
     def _save_to_cache(self, series_id: str, df: pd.DataFrame):
         """Save series data to database cache"""
         if not self.db or df.empty:
             return
 
         try:
-            # Determine data type
-            if series_id in self.CURRENCY_SERIES.values():
-                data_type = 'fx_rate'
-            elif series_id in self.TREASURY_SERIES.values():
-                data_type = 'yield'
-            elif series_id in self.CREDIT_SPREAD_SERIES.values():
-                data_type = 'credit_spread'
-            elif series_id == 'GC=F':
-                data_type = 'gold'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('buffett_indicator')]:
-                data_type = 'buffett_indicator'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('gdp')]:
-                data_type = 'gdp'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('m2'), self.GLOBAL_ECONOMY_SERIES.get('m2_velocity')]:
-                data_type = 'money_supply'
-            elif series_id in [self.GLOBAL_ECONOMY_SERIES.get('debt_gdp'), self.GLOBAL_ECONOMY_SERIES.get('debt_public_gdp')]:
-                data_type = 'debt'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('case_shiller_national'),
-                              self.REAL_ESTATE_SERIES.get('case_shiller_20city'),
-                              self.REAL_ESTATE_SERIES.get('median_home_price')]:
-                data_type = 'housing_price'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('housing_starts'),
-                              self.REAL_ESTATE_SERIES.get('building_permits'),
-                              self.REAL_ESTATE_SERIES.get('existing_home_sales')]:
-                data_type = 'housing_activity'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('housing_inventory'),
-                              self.REAL_ESTATE_SERIES.get('months_supply'),
-                              self.REAL_ESTATE_SERIES.get('new_home_months_supply')]:
-                data_type = 'housing_inventory'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('mortgage_30y')]:
-                data_type = 'mortgage'
-            elif series_id in [self.REAL_ESTATE_SERIES.get('affordability_index'),
-                              self.REAL_ESTATE_SERIES.get('median_income'),
-                              self.REAL_ESTATE_SERIES.get('mortgage_debt_service')]:
-                data_type = 'affordability'
-            elif series_id in [self.INFLATION_SERIES.get('cpi'),
-                              self.INFLATION_SERIES.get('core_cpi'),
-                              self.INFLATION_SERIES.get('pce'),
-                              self.INFLATION_SERIES.get('core_pce')]:
-                data_type = 'inflation'
-            elif series_id in [self.INFLATION_SERIES.get('breakeven_5y'),
-                              self.INFLATION_SERIES.get('breakeven_10y')]:
-                data_type = 'breakeven'
-            elif series_id in [self.INFLATION_SERIES.get('fed_funds')]:
-                data_type = 'fed_funds'
-            elif series_id in [self.INFLATION_SERIES.get('fed_assets')]:
-                data_type = 'fed_assets'
-            elif series_id in ['^VIX', '^VIX3M']:
-                data_type = 'vix'
-            else:
+            data_type = _series_to_data_type(series_id)
+            if data_type is None:
                 return
 
-            # Convert DataFrame to list of dicts for database
-            observations = [
-                {'date': row['date'].strftime('%Y-%m-%d'), 'value': row['value']}
-                for _, row in df.iterrows()
-            ]
+            # Hand the columns to the database as plain lists (dates formatted
+            # in one vectorized pass, no per-observation dicts)
+            dates = _to_date_strs(df['date'])
 
-            self.db.save_macro_data(data_type, series_id, observations)
-            logger.info(f"Saved {len(observations)} observations for {series_id} to cache")
+            with self._db_lock:
+                self.db.upsert_macro_series(data_type, series_id, dates, df['value'].tolist())
+            logger.info("Saved %d observations for %s to cache", len(dates), series_id)
 
         except Exception as e:
             logger.error(f"Error saving cache for {series_id}: {e}")
@@ -273,6 +564,10 @@ class MacroDataFetcher:
         """
         Fetch a FRED data series with caching support
 
+        Concurrent calls for the same series are coalesced: the first one
+        goes to the database or FRED, the others wait and are then served
+        from the memory cache.
+
         Args:
             series_id: FRED series identifier
             start_date: Start date in YYYY-MM-DD format
@@ -282,10 +577,44 @@ class MacroDataFetcher:
         Returns:
             DataFrame with columns: date, value
         """
-        # Try cache first
+        if not use_cache:
+            return self._load_series(series_id, start_date, end_date, use_cache=False)
+
+        with self._series_lock(series_id):
+            return self._load_series(series_id, start_date, end_date)
+
+    def _load_series(self, series_id: str, start_date: Optional[str] = None,
+                     end_date: Optional[str] = None, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Load a FRED data series from the memory cache, database cache or API
+
+        Args:
+            series_id: FRED series identifier
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            use_cache: Whether to use database cache (default True)
+
+        Returns:
+            DataFrame with columns: date, value
+        """
+        # Try memory cache, then database cache
+        mem_key = (series_id, start_date, end_date)
+        cached_df = None
         if use_cache:
-            cached_df = self._get_cached_series(series_id, start_date)
-            if cached_df is not None:
+            remembered_df = self._recall_series(mem_key)
+            if remembered_df is not None:
+                return remembered_df
+
+            if end_date is None:
+                sliced_df = self._slice_remembered_series(series_id, start_date)
+                if sliced_df is not None:
+                    self._remember_series(mem_key, sliced_df)
+                    return sliced_df
+
+            cached_df = self._read_cached_series(series_id, start_date)
+            if cached_df is not None and self._is_cache_fresh(series_id, cached_df,
+                                                              check_fred_updates=True):
+                self._remember_series(mem_key, cached_df)
                 return cached_df
 
         # Cache miss or disabled - fetch from API
@@ -293,6 +622,7 @@ class MacroDataFetcher:
             'series_id': series_id,
             'api_key': self.api_key,
             'file_type': 'json',
+            'sort_order': 'asc',  # FRED's default, relied on below
         }
 
         if start_date:
@@ -300,8 +630,15 @@ class MacroDataFetcher:
         if end_date:
             params['observation_end'] = end_date
 
+        # A stale cache that covers the window only needs the observations
+        # since its latest date; the overlap picks up recent revisions
+        incremental = cached_df is not None and end_date is None
+        if incremental:
+            overlap_start = self._overlap_start(series_id, cached_df, start_date)
+            params['observation_start'] = overlap_start.strftime('%Y-%m-%d')
+
         try:
-            response = requests.get(self.FRED_BASE_URL, params=params, timeout=10)
+            response = self._http.get(self.FRED_BASE_URL, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -312,22 +649,35 @@ class MacroDataFetcher:
 
             observations = data['observations']
 
-            # Filter out missing values (FRED uses '.' for missing data)
-            valid_obs = [
-                {'date': obs['date'], 'value': float(obs['value'])}
-                for obs in observations
-                if obs['value'] != '.'
-            ]
-
-            df = pd.DataFrame(valid_obs)
+            # Filter out missing values (FRED uses '.' for missing data) while
+            # collecting the two columns, then parse each in one vectorized pass
+            dates = [obs['date'] for obs in observations if obs['value'] != '.']
+            values = [obs['value'] for obs in observations if obs['value'] != '.']
+            df = pd.DataFrame({
+                'date': pd.to_datetime(dates, format='%Y-%m-%d', cache=True),
+                'value': np.array(values, dtype=np.float64),
+            })
             if not df.empty:
-                df['date'] = pd.to_datetime(df['date'])
-                df = df.sort_values('date')
+                # Observations come back in ascending date order; only sort
+                # if that ever changes
+                if not df['date'].is_monotonic_increasing:
+                    df = df.sort_values('date', ignore_index=True)
 
                 # Save to cache
                 if use_cache:
                     self._save_to_cache(series_id, df)
 
+            if incremental:
+                # Fetched observations supersede cached ones from the overlap on
+                if df.empty:
+                    df = cached_df
+                else:
+                    df = pd.concat([cached_df[cached_df['date'] < df['date'].iat[0]], df],
+                                   ignore_index=True)
+
+            if use_cache:
+                self._remember_series(mem_key, df)
+
             return df
 
         except requests.exceptions.RequestException as e:
@@ -337,6 +687,51 @@ class MacroDataFetcher:
             logger.error(f"Error parsing FRED data for {series_id}: {e}")
             return pd.DataFrame(columns=['date', 'value'])
 
+    def fetch_many(self, series_ids: List[str],
+                   start_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several FRED series concurrently
+
+        Each series goes through _fetch_series (memory cache, database cache,
+        then FRED); the network requests overlap instead of running back to back.
+
+        Args:
+            series_ids: FRED series identifiers
+            start_date: Start date in YYYY-MM-DD format
+
+        Returns:
+            Dict of series_id to DataFrame with date and value columns
+        """
+        series_ids = list(dict.fromkeys(series_ids))
+        if len(series_ids) <= 1:
+            return {series_id: self._fetch_series(series_id, start_date=start_date) for series_id in series_ids}
+
+        with ThreadPoolExecutor(max_workers=min(self.FETCH_WORKERS, len(series_ids))) as executor:
+            frames = executor.map(lambda series_id: self._fetch_series(series_id, start_date=start_date),
+                                  series_ids)
+            return dict(zip(series_ids, frames))
+
+    @staticmethod
+    def _nearest_date_index(dates: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Find the observation closest to each target date
+
+        Distances are measured in whole days and ties go to the earlier date.
+
+        Args:
+            dates: Sorted, non-empty datetime64 array of observation dates
+            targets: datetime64 array of target dates
+
+        Returns:
+            Array of indices into dates, one per target
+        """
+        one_day = np.timedelta64(1, 'D')
+        after = np.searchsorted(dates, targets).clip(max=len(dates) - 1)
+        before = (after - 1).clip(min=0)
+        before_diff = np.abs((dates[before] - targets) // one_day)
+        after_diff = np.abs((dates[after] - targets) // one_day)
+        return np.where(before_diff <= after_diff, before, after)
+
     def _calculate_period_return(self, df: pd.DataFrame, days_back: int) -> Optional[float]:
         """
         Calculate percentage return over a period
@@ -351,24 +746,83 @@ class MacroDataFetcher:
         if df.empty or len(df) < 2:
             return None
 
-        latest_value = df.iloc[-1]['value']
-        target_date = df.iloc[-1]['date'] - timedelta(days=days_back)
+        dates = df['date'].to_numpy()
+        values = df['value'].to_numpy()
+        latest_value = values[-1]
+        target_date = dates[-1] - np.timedelta64(days_back, 'D')
 
         # Find closest date to target
-        df_sorted = df[df['date'] <= df.iloc[-1]['date']].copy()
-        df_sorted['date_diff'] = abs((df_sorted['date'] - target_date).dt.days)
-        closest_row = df_sorted.nsmallest(1, 'date_diff')
-
-        if closest_row.empty:
-            return None
-
-        previous_value = closest_row.iloc[0]['value']
+        previous_value = values[self._nearest_date_index(dates, np.array([target_date]))[0]]
 
         if previous_value == 0 or pd.isna(previous_value):
             return None
 
         return ((latest_value - previous_value) / previous_value) * 100
 
+    @classmethod
+    def _calculate_period_returns(cls, dates: np.ndarray, values: np.ndarray,
+                                  timeframes: Dict[str, int]) -> Dict[str, np.ndarray]:
+        """
+        Calculate percentage returns for several series over several periods at once
+
+        Vectorized counterpart of _calculate_period_return for series laid out
+        as columns on shared dates. NaN marks a date missing from a column, so
+        each column uses its own latest observation and, for each period, the
+        observation closest to (latest date - days), the earlier one on ties.
+
+        Args:
+            dates: Sorted datetime64 array of observation dates
+            values: 2D array of values, one row per date and one column per series
+            timeframes: Mapping of period label to days back
+
+        Returns:
+            Dict of period label to array of returns per column (NaN if not available)
+        """
+        days_back = np.array(list(timeframes.values()), dtype='timedelta64[D]')
+        returns = np.full((len(days_back), values.shape[1]), np.nan)
+
+        for col in range(values.shape[1]):
+            valid = ~np.isnan(values[:, col])
+            col_dates = dates[valid]
+            col_values = values[valid, col]
+            if len(col_values) < 2:
+                continue
+
+            previous = col_values[cls._nearest_date_index(col_dates, col_dates[-1] - days_back)]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                returns[:, col] = np.where(previous == 0, np.nan,
+                                           (col_values[-1] - previous) / previous * 100)
+
+        return dict(zip(timeframes, returns))
+
+    def _calculate_series_returns(self, df: pd.DataFrame,
+                                  timeframes: Dict[str, int]) -> Dict[str, Optional[float]]:
+        """
+        Calculate percentage returns of one series over several periods
+
+        The date and value columns are extracted once as numpy arrays and
+        shared by all periods, instead of calling _calculate_period_return
+        per period.
+
+        Args:
+            df: DataFrame with date and value columns
+            timeframes: Mapping of period label to days back
+
+        Returns:
+            Dict of period label to percentage return (None if not available)
+        """
+        if df.empty:
+            return dict.fromkeys(timeframes)
+
+        dates = df['date'].to_numpy()
+        values = df['value'].to_numpy(dtype=np.float64)
+        returns = self._calculate_period_returns(dates, values[:, None], timeframes)
+
+        return {
+            period: None if np.isnan(period_returns[0]) else float(period_returns[0])
+            for period, period_returns in returns.items()
+        }
+
     def fetch_exchange_rate(self, currency: str, lookback_days: int = 1825) -> pd.DataFrame:
         """
         Fetch exchange rate data for a currency
@@ -385,62 +839,236 @@ class MacroDataFetcher:
             return pd.DataFrame(columns=['date', 'value'])
 
         series_id = self.CURRENCY_SERIES[currency]
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         return self._fetch_series(series_id, start_date=start_date)
 
-    def fetch_gold_price(self, lookback_days: int = 1825, use_cache: bool = True) -> pd.DataFrame:
+    def _fetch_yahoo_series(self, series_id: str, lookback_days: int,
+                            use_cache: bool = True) -> pd.DataFrame:
         """
-        Fetch gold price data from Yahoo Finance with caching
+        Fetch a Yahoo Finance ticker's daily closes with caching support
+
+        Concurrent calls for the same ticker are coalesced like in _fetch_series.
 
         Args:
-            lookback_days: Days of history to fetch (default 5 years)
+            series_id: Yahoo Finance ticker (e.g. GC=F, ^GSPC, ^VIX)
+            lookback_days: Days of history to fetch
             use_cache: Whether to use database cache (default True)
 
         Returns:
             DataFrame with date and value columns
         """
-        series_id = 'GC=F'  # Gold futures ticker
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        if not use_cache:
+            return self._load_yahoo_series(series_id, lookback_days, use_cache=False)
+
+        with self._series_lock(series_id):
+            return self._load_yahoo_series(series_id, lookback_days)
 
-        # Try cache first
+    def _load_yahoo_series(self, series_id: str, lookback_days: int,
+                           use_cache: bool = True) -> pd.DataFrame:
+        """
+        Load a Yahoo Finance ticker's daily closes from the memory cache, database cache or Yahoo
+
+        Args:
+            series_id: Yahoo Finance ticker (e.g. GC=F, ^GSPC, ^VIX)
+            lookback_days: Days of history to fetch
+            use_cache: Whether to use database cache (default True)
+
+        Returns:
+            DataFrame with date and value columns
+        """
+        # Same reference time for the cache key and the download window
+        end_dt = self._current_time().to_pydatetime()
+        start_dt = end_dt - timedelta(days=lookback_days)
+        start_date = start_dt.strftime('%Y-%m-%d')
+
+        # Try memory cache, then database cache
+        mem_key = (series_id, start_date, None)
+        cached_df = None
         if use_cache:
-            cached_df = self._get_cached_series(series_id, start_date)
-            if cached_df is not None:
+            remembered_df = self._recall_series(mem_key)
+            if remembered_df is not None:
+                return remembered_df
+
+            sliced_df = self._slice_remembered_series(series_id, start_date)
+            if sliced_df is not None:
+                self._remember_series(mem_key, sliced_df)
+                return sliced_df
+
+            cached_df = self._read_cached_series(series_id, start_date)
+            if cached_df is not None and self._is_cache_fresh(series_id, cached_df):
+                self._remember_series(mem_key, cached_df)
                 return cached_df
 
+        # A stale cache that covers the window only needs the closes since
+        # its latest date, and only those rows are written back
+        incremental = cached_df is not None
+        if incremental:
+            start_dt = self._overlap_start(series_id, cached_df, start_date).to_pydatetime()
+
         # Cache miss - fetch from Yahoo Finance
         try:
-            gold = yf.Ticker(series_id)
-            end_date = datetime.now()
-            start_date_dt = end_date - timedelta(days=lookback_days)
-
-            hist = gold.history(start=start_date_dt, end=end_date)
+            ticker = yf.Ticker(series_id)
+            hist = ticker.history(start=start_dt, end=end_dt)
 
             if hist.empty:
-                logger.warning("No gold price data available from Yahoo Finance")
+                if incremental:
+                    self._remember_series(mem_key, cached_df)
+                    return cached_df
+                logger.warning(f"No {series_id} data available from Yahoo Finance")
                 return pd.DataFrame(columns=['date', 'value'])
 
             # Convert to FRED-like format
-            df = pd.DataFrame({
-                'date': hist.index,
-                'value': hist['Close']
-            })
-            df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)  # Remove timezone for consistency with FRED
-            df = df.sort_values('date').reset_index(drop=True)
+            df = _close_frame(hist['Close'])
 
-            logger.info(f"Fetched {len(df)} gold price observations from Yahoo Finance")
+            logger.info("Fetched %d %s observations from Yahoo Finance", len(df), series_id)
 
             # Save to cache
             if use_cache:
                 self._save_to_cache(series_id, df)
 
+            if incremental:
+                # Downloaded closes supersede cached ones from the overlap on
+                df = pd.concat([cached_df[cached_df['date'] < df['date'].iat[0]], df],
+                               ignore_index=True)
+
+            if use_cache:
+                self._remember_series(mem_key, df)
+
             return df
 
         except Exception as e:
-            logger.error(f"Error fetching gold price from Yahoo Finance: {e}")
+            logger.error(f"Error fetching {series_id} from Yahoo Finance: {e}")
             return pd.DataFrame(columns=['date', 'value'])
 
+    def _fetch_yahoo_monthly(self, series_id: str, lookback_years: int) -> pd.DataFrame:
+        """
+        Fetch a Yahoo Finance ticker's monthly closes, memoized per fetcher
+
+        Monthly bars are not stored in the database cache, but repeated
+        lookups within a refresh are served from memory instead of Yahoo.
+
+        Args:
+            series_id: Yahoo Finance ticker (e.g. ^W5000)
+            lookback_years: Years of history to fetch
+
+        Returns:
+            DataFrame with timezone-naive date and value columns (empty on failure)
+        """
+        # The interval in the end slot keeps monthly bars out of daily window slicing
+        mem_key = (series_id, f"{lookback_years}y", '1mo')
+        remembered_df = self._recall_series(mem_key)
+        if remembered_df is not None:
+            return remembered_df
+
+        try:
+            hist = yf.Ticker(series_id).history(period=f"{lookback_years}y", interval="1mo")
+        except Exception as e:
+            logger.error(f"Error fetching {series_id} from Yahoo Finance: {e}")
+            return pd.DataFrame(columns=['date', 'value'])
+
+        if hist.empty:
+            return pd.DataFrame(columns=['date', 'value'])
+
+        df = _close_frame(hist['Close'])
+        self._remember_series(mem_key, df)
+        return df
+
+    def fetch_gold_price(self, lookback_days: int = 1825, use_cache: bool = True) -> pd.DataFrame:
+        """
+        Fetch gold price data from Yahoo Finance with caching
+
+        Args:
+            lookback_days: Days of history to fetch (default 5 years)
+            use_cache: Whether to use database cache (default True)
+
+        Returns:
+            DataFrame with date and value columns
+        """
+        return self._fetch_yahoo_series('GC=F', lookback_days, use_cache)  # Gold futures ticker
+
+    def fetch_yahoo_batch(self, tickers: List[str], lookback_days: int = 1825) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch daily closing prices for several Yahoo Finance tickers in one request
+
+        Args:
+            tickers: Yahoo Finance tickers (e.g. ['GC=F', '^GSPC'])
+            lookback_days: Days of history to fetch (default 5 years)
+
+        Returns:
+            Dict of ticker to DataFrame with date and value columns; tickers
+            without data are left out
+        """
+        end_date = self._current_time().to_pydatetime()
+        start_date = end_date - timedelta(days=lookback_days)
+
+        try:
+            # auto_adjust matches the Close column of Ticker.history()
+            data = yf.download(tickers, start=start_date, end=end_date, group_by='ticker',
+                               threads=True, progress=False, auto_adjust=True)
+        except Exception as e:
+            logger.error(f"Error fetching {', '.join(tickers)} from Yahoo Finance: {e}")
+            return {}
+
+        results = {}
+        if data is None or data.empty:
+            logger.warning(f"No data available from Yahoo Finance for {', '.join(tickers)}")
+            return results
+
+        for ticker in tickers:
+            if ticker not in data.columns.get_level_values(0):
+                continue
+
+            # Rows are the union of all tickers' trading days
+            close = data[ticker]['Close'].dropna()
+            if close.empty:
+                continue
+
+            results[ticker] = _close_frame(close)
+
+        logger.info("Fetched %d/%d tickers from Yahoo Finance in one batch", len(results), len(tickers))
+        return results
+
+    def prefetch_yahoo_series(self, tickers: List[str], lookback_days: int = 1825):
+        """
+        Warm the caches for several Yahoo Finance tickers with a single download
+
+        Tickers that are already cached are skipped. The rest are fetched
+        through fetch_yahoo_batch() and stored in the memory and database
+        caches, so later single-ticker calls with the same lookback (e.g.
+        fetch_gold_price, calculate_sp500_returns) are served from cache.
+
+        Args:
+            tickers: Yahoo Finance tickers (e.g. ['GC=F', '^GSPC'])
+            lookback_days: Days of history to fetch (default 5 years)
+        """
+        start_date = self._start_date(lookback_days)
+
+        missing = []
+        for ticker in tickers:
+            mem_key = (ticker, start_date, None)
+            if self._recall_series(mem_key) is not None:
+                continue
+
+            # A wider window already in memory covers this one
+            sliced_df = self._slice_remembered_series(ticker, start_date)
+            if sliced_df is not None:
+                self._remember_series(mem_key, sliced_df)
+                continue
+
+            cached_df = self._get_cached_series(ticker, start_date)
+            if cached_df is not None:
+                self._remember_series(mem_key, cached_df)
+            else:
+                missing.append(ticker)
+
+        if not missing:
+            return
+
+        for ticker, df in self.fetch_yahoo_batch(missing, lookback_days).items():
+            self._save_to_cache(ticker, df)
+            self._remember_series((ticker, start_date, None), df)
+
     def calculate_currency_returns(self, base: str = 'USD') -> List[Dict]:
         """
         Calculate currency returns vs USD across multiple timeframes
@@ -461,33 +1089,29 @@ class MacroDataFetcher:
             '5y': 1825,
         }
 
+        # Download the FX series concurrently
+        frames = self.fetch_many(list(self.CURRENCY_SERIES.values()),
+                                 start_date=self._start_date(1825))
+
         results = []
 
         for currency, series_id in self.CURRENCY_SERIES.items():
-            df = self.fetch_exchange_rate(currency, lookback_days=1825)
+            df = frames[series_id]
 
             currency_data = {
                 'name': currency,
                 'code': currency,
             }
 
-            for period, days in timeframes.items():
-                return_pct = self._calculate_period_return(df, days)
-                # FRED FX rate interpretation:
-                # EUR (DEXUSEU): USD per EUR - if it goes up, EUR strengthened (positive return = EUR gained)
-                # JPY/CNY/CHF (DEXJPUS/DEXCHUS/DEXSZUS): Foreign per USD - if it goes down, foreign strengthened
-                if return_pct is not None:
-                    if currency == 'EUR':
-                        # DEXUSEU is USD per EUR, so positive return = EUR strengthened
-                        # No inversion needed
-                        currency_data[period] = return_pct
-                    else:
-                        # For JPY, CNY, CHF: series is foreign per USD
-                        # If rate increases (more JPY per USD), JPY weakened, so we invert
-                        # If rate decreases (less JPY per USD), JPY strengthened, so we invert
-                        currency_data[period] = -return_pct
-                else:
-                    currency_data[period] = None
+            # FRED FX rate interpretation:
+            # EUR (DEXUSEU): USD per EUR - if it goes up, EUR strengthened (positive return = EUR gained),
+            # so no inversion is needed
+            # JPY/CNY/CHF (DEXJPUS/DEXCHUS/DEXSZUS): Foreign per USD - if the rate increases (more JPY
+            # per USD), JPY weakened, and if it decreases, JPY strengthened, so we invert
+            sign = 1 if currency == 'EUR' else -1
+
+            for period, return_pct in self._calculate_series_returns(df, timeframes).items():
+                currency_data[period] = sign * return_pct if return_pct is not None else None
 
             results.append(currency_data)
 
@@ -520,8 +1144,7 @@ class MacroDataFetcher:
             'code': 'USD',
         }
 
-        for period, days in timeframes.items():
-            gold_return = self._calculate_period_return(df, days)
+        for period, gold_return in self._calculate_series_returns(df, timeframes).items():
             # Currency vs Gold = - (Gold price return in that currency)
             # If gold price in USD +150%, USD lost 150% purchasing power → -150%
             gold_data[period] = -gold_return if gold_return is not None else None
@@ -551,60 +1174,52 @@ class MacroDataFetcher:
         # Get gold price in USD
         gold_usd_df = self.fetch_gold_price(lookback_days=1825)
 
-        results = []
-
-        # USD vs Gold (already calculated, but include here for consistency)
-        usd_data = {
-            'name': 'USD',
-            'code': 'USD',
-        }
-        for period, days in timeframes.items():
-            gold_return_usd = self._calculate_period_return(gold_usd_df, days)
-            # If gold price in USD +150%, USD lost 150% → -150%
-            usd_data[period] = -gold_return_usd if gold_return_usd is not None else None
-        results.append(usd_data)
-
-        # Other currencies vs Gold
-        # Gold price in EUR = Gold price in USD × (EUR per USD) = Gold price in USD / (USD per EUR)
-        # We need to calculate: (Gold_EUR_now / Gold_EUR_then - 1) then invert
-
-        for currency in ['EUR', 'JPY', 'CNY', 'CHF']:
-            fx_df = self.fetch_exchange_rate(currency, lookback_days=1825)
-
-            if fx_df.empty:
-                continue
+        if gold_usd_df.empty:
+            return [{'name': 'USD', 'code': 'USD', **dict.fromkeys(timeframes)}]
+
+        # Download the FX series concurrently, then join all rates onto the
+        # gold dates in one go; currencies without a rate on a given date get NaN there
+        currencies = ['EUR', 'JPY', 'CNY', 'CHF']
+        frames = self.fetch_many([self.CURRENCY_SERIES[currency] for currency in currencies],
+                                 start_date=self._start_date(1825))
+        fx_rates = {}
+        for currency in currencies:
+            fx_df = frames[self.CURRENCY_SERIES[currency]]
+            if not fx_df.empty:
+                fx_rates[currency] = fx_df.set_index('date')['value']
+
+        merged = gold_usd_df.set_index('date')[['value']]
+        if fx_rates:
+            merged = merged.join(pd.concat(fx_rates, axis=1), how='left')
+
+        # Gold price in each currency, USD first
+        # DEXUSEU = USD per EUR, so Gold_EUR = Gold_USD / (USD per EUR)
+        # For JPY/CNY/CHF: series is foreign per USD, so Gold_JPY = Gold_USD × (JPY per USD)
+        gold_usd = merged['value'].to_numpy(dtype=np.float64)
+        fx = merged[list(fx_rates)].to_numpy(dtype=np.float64)
+        is_eur = np.array([currency == 'EUR' for currency in fx_rates])
+        gold_local = np.column_stack([
+            gold_usd,
+            np.where(is_eur, gold_usd[:, None] / fx, gold_usd[:, None] * fx),
+        ])
+
+        returns = self._calculate_period_returns(merged.index.to_numpy(), gold_local, timeframes)
 
-            # Merge FX rate with gold price on date
-            merged = pd.merge(gold_usd_df, fx_df, on='date', suffixes=('_gold', '_fx'))
-
-            if merged.empty:
+        results = []
+        for col, currency in enumerate(['USD', *fx_rates]):
+            # Skip currencies with no FX rate on any gold date
+            if np.isnan(gold_local[:, col]).all():
                 continue
 
-            # Calculate gold price in local currency
-            if currency == 'EUR':
-                # DEXUSEU = USD per EUR, so Gold_EUR = Gold_USD / (USD per EUR)
-                merged['gold_local'] = merged['value_gold'] / merged['value_fx']
-            else:
-                # For JPY/CNY/CHF: series is foreign per USD
-                # Gold_JPY = Gold_USD × (JPY per USD)
-                merged['gold_local'] = merged['value_gold'] * merged['value_fx']
-
-            # Create dataframe for local gold price
-            gold_local_df = pd.DataFrame({
-                'date': merged['date'],
-                'value': merged['gold_local']
-            })
-
             currency_data = {
                 'name': currency,
                 'code': currency,
             }
-
-            for period, days in timeframes.items():
-                gold_return_local = self._calculate_period_return(gold_local_df, days)
+            for period in timeframes:
+                gold_return = returns[period][col]
                 # Currency vs Gold = - (Gold price return in that currency)
                 # If gold price in EUR +154%, EUR lost 154% purchasing power → -154%
-                currency_data[period] = -gold_return_local if gold_return_local is not None else None
+                currency_data[period] = None if np.isnan(gold_return) else -float(gold_return)
 
             results.append(currency_data)
 
@@ -630,77 +1245,15 @@ class MacroDataFetcher:
             '5y': 1825,
         }
 
-        series_id = '^GSPC'
-        start_date_str = (datetime.now() - timedelta(days=1825)).strftime('%Y-%m-%d')
-
-        # Try cache first
-        df = None
-        if use_cache:
-            # For S&P 500, we'll use 'sp500' as data_type in cache check
-            # Update _get_cached_series to handle this
-            try:
-                if self.db:
-                    cached_df = self.db.get_macro_data('sp500', series_id, start_date=start_date_str)
-                    if not cached_df.empty:
-                        latest_date = pd.to_datetime(cached_df['date'].max())
-                        cache_age = datetime.now() - latest_date.replace(tzinfo=None)
-                        if cache_age.total_seconds() / 3600 <= self.cache_hours:
-                            logger.info(f"Using cached S&P 500 data (age: {cache_age.total_seconds()/3600:.1f}h)")
-                            df = cached_df
-            except Exception as e:
-                logger.error(f"Error reading S&P 500 cache: {e}")
-
-        # Cache miss - fetch from Yahoo Finance
-        if df is None:
-            try:
-                sp500 = yf.Ticker(series_id)
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=1825)
-
-                hist = sp500.history(start=start_date, end=end_date)
-
-                if hist.empty:
-                    logger.warning("No S&P 500 data available from Yahoo Finance")
-                    return {'name': 'S&P 500', 'code': 'SPX', **{p: None for p in timeframes.keys()}}
-
-                # Convert to FRED-like format
-                df = pd.DataFrame({
-                    'date': hist.index,
-                    'value': hist['Close']
-                })
-                df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
-                df = df.sort_values('date').reset_index(drop=True)
-
-                logger.info(f"Fetched {len(df)} S&P 500 observations from Yahoo Finance")
-
-                # Save to cache
-                if use_cache and self.db:
-                    try:
-                        observations = [
-                            {'date': row['date'].strftime('%Y-%m-%d'), 'value': row['value']}
-                            for _, row in df.iterrows()
-                        ]
-                        self.db.save_macro_data('sp500', series_id, observations)
-                        logger.info(f"Saved S&P 500 data to cache")
-                    except Exception as e:
-                        logger.error(f"Error saving S&P 500 cache: {e}")
-
-            except Exception as e:
-                logger.error(f"Error fetching S&P 500 from Yahoo Finance: {e}")
-                return {'name': 'S&P 500', 'code': 'SPX', **{p: None for p in timeframes.keys()}}
+        df = self._fetch_yahoo_series('^GSPC', 1825, use_cache)
 
         # Calculate returns
-        sp500_data = {
+        return {
             'name': 'S&P 500',
             'code': 'SPX',
+            **self._calculate_series_returns(df, timeframes),
         }
 
-        for period, days in timeframes.items():
-            return_pct = self._calculate_period_return(df, days)
-            sp500_data[period] = return_pct
-
-        return sp500_data
-
     def fetch_yield_curve(self) -> Dict:
         """
         Fetch current Treasury yields for yield curve visualization
@@ -711,12 +1264,15 @@ class MacroDataFetcher:
         yields = {}
 
         # Use 90 days lookback to ensure we get recent data even with weekends/holidays
+        start_date = self._start_date(90)
+        frames = self.fetch_many(list(self.TREASURY_SERIES.values()), start_date=start_date)
+
         for maturity, series_id in self.TREASURY_SERIES.items():
-            df = self._fetch_series(series_id, start_date=(datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d'))
+            df = frames[series_id]
 
             if not df.empty:
-                yields[maturity] = df.iloc[-1]['value']
-                logger.info(f"Fetched {maturity} yield: {yields[maturity]}% (date: {df.iloc[-1]['date']})")
+                yields[maturity] = df['value'].iat[-1]
+                logger.info(f"Fetched {maturity} yield: {yields[maturity]}% (date: {df['date'].iat[-1]})")
             else:
                 logger.warning(f"No data available for {maturity} Treasury (series {series_id})")
                 yields[maturity] = None
@@ -732,152 +1288,76 @@ class MacroDataFetcher:
         """
         # Fetch data for key maturities
         lookback_days = 1095  # 3 years for context
+        start_date = self._start_date(lookback_days)
 
-        yields_10y = self._fetch_series(self.TREASURY_SERIES['10Y'],
-                                        start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d'))
-        yields_2y = self._fetch_series(self.TREASURY_SERIES['2Y'],
-                                       start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d'))
-        yields_3m = self._fetch_series(self.TREASURY_SERIES['3M'],
-                                       start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d'))
-        yields_30y = self._fetch_series(self.TREASURY_SERIES['30Y'],
-                                        start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d'))
-        yields_5y = self._fetch_series(self.TREASURY_SERIES['5Y'],
-                                       start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d'))
+        frames = self.fetch_many(
+            [self.TREASURY_SERIES[maturity] for maturity in ['10Y', '2Y', '3M', '30Y', '5Y']],
+            start_date=start_date
+        )
+        yields_10y = frames[self.TREASURY_SERIES['10Y']]
+        yields_2y = frames[self.TREASURY_SERIES['2Y']]
+        yields_3m = frames[self.TREASURY_SERIES['3M']]
+        yields_30y = frames[self.TREASURY_SERIES['30Y']]
+        yields_5y = frames[self.TREASURY_SERIES['5Y']]
 
         spreads = {}
 
-        # Helper function to calculate spread at a specific lookback period
-        def get_historical_spread(df1, df2, days_back):
-            """Get spread value from days_back ago"""
-            if df1.empty or df2.empty:
-                return None
-
-            target_date = df1.iloc[-1]['date'] - timedelta(days=days_back)
-            hist_df1 = df1[df1['date'] <= target_date]
-            hist_df2 = df2[df2['date'] <= target_date]
+        # Trend thresholds: the long-end 30Y-5Y spread moves less, so it is
+        # considered expanding/contracting on smaller changes
+        for key, long_df, short_df, trend_threshold in [
+            ('10y2y', yields_10y, yields_2y, 0.1),
+            ('10y3m', yields_10y, yields_3m, 0.1),
+            ('30y5y', yields_30y, yields_5y, 0.05),
+        ]:
+            if not long_df.empty and not short_df.empty:
+                spreads[key] = self._summarize_spread(long_df, short_df, trend_threshold)
 
-            if not hist_df1.empty and not hist_df2.empty:
-                return hist_df1.iloc[-1]['value'] - hist_df2.iloc[-1]['value']
-            return None
+        return spreads
 
-        # 10Y-2Y spread
-        if not yields_10y.empty and not yields_2y.empty:
-            current_10y = yields_10y.iloc[-1]['value']
-            current_2y = yields_2y.iloc[-1]['value']
-            spread_current = current_10y - current_2y
-
-            # Historical spreads
-            spread_1m = get_historical_spread(yields_10y, yields_2y, 30)
-            spread_3m = get_historical_spread(yields_10y, yields_2y, 90)
-            spread_6m = get_historical_spread(yields_10y, yields_2y, 180)
-            spread_1y = get_historical_spread(yields_10y, yields_2y, 365)
-
-            # Calculate changes
-            change_1m = (spread_current - spread_1m) if spread_1m is not None else None
-            change_3m = (spread_current - spread_3m) if spread_3m is not None else None
-            change_6m = (spread_current - spread_6m) if spread_6m is not None else None
-            change_1y = (spread_current - spread_1y) if spread_1y is not None else None
-
-            # Determine trend (expanding = widening, contracting = narrowing)
-            trend = None
-            if change_3m is not None:
-                if change_3m > 0.1:
-                    trend = 'EXPANDING'
-                elif change_3m < -0.1:
-                    trend = 'CONTRACTING'
-                else:
-                    trend = 'STABLE'
+    @staticmethod
+    def _summarize_spread(long_df: pd.DataFrame, short_df: pd.DataFrame,
+                          trend_threshold: float) -> Dict:
+        """
+        Summarize a yield spread: current value, past values, changes and trend
 
-            spreads['10y2y'] = {
-                'current': round(spread_current, 2),
-                '1m_ago': round(spread_1m, 2) if spread_1m is not None else None,
-                '3m_ago': round(spread_3m, 2) if spread_3m is not None else None,
-                '6m_ago': round(spread_6m, 2) if spread_6m is not None else None,
-                '1y_ago': round(spread_1y, 2) if spread_1y is not None else None,
-                'change_1m': round(change_1m, 2) if change_1m is not None else None,
-                'change_3m': round(change_3m, 2) if change_3m is not None else None,
-                'change_6m': round(change_6m, 2) if change_6m is not None else None,
-                'change_1y': round(change_1y, 2) if change_1y is not None else None,
-                'trend': trend,
-            }
+        Args:
+            long_df: Yields of the longer maturity (date, value), sorted by date
+            short_df: Yields of the shorter maturity (date, value), sorted by date
+            trend_threshold: 3-month change (in points) beyond which the spread
+                is considered expanding or contracting
 
-        # 10Y-3M spread
-        if not yields_10y.empty and not yields_3m.empty:
-            current_10y = yields_10y.iloc[-1]['value']
-            current_3m = yields_3m.iloc[-1]['value']
-            spread_current = current_10y - current_3m
-
-            spread_1m = get_historical_spread(yields_10y, yields_3m, 30)
-            spread_3m = get_historical_spread(yields_10y, yields_3m, 90)
-            spread_6m = get_historical_spread(yields_10y, yields_3m, 180)
-            spread_1y = get_historical_spread(yields_10y, yields_3m, 365)
-
-            change_1m = (spread_current - spread_1m) if spread_1m is not None else None
-            change_3m = (spread_current - spread_3m) if spread_3m is not None else None
-            change_6m = (spread_current - spread_6m) if spread_6m is not None else None
-            change_1y = (spread_current - spread_1y) if spread_1y is not None else None
-
-            trend = None
-            if change_3m is not None:
-                if change_3m > 0.1:
-                    trend = 'EXPANDING'
-                elif change_3m < -0.1:
-                    trend = 'CONTRACTING'
-                else:
-                    trend = 'STABLE'
+        Returns:
+            Dict with current spread, values 1m/3m/6m/1y ago, changes since and trend
+        """
+        values_long = long_df['value'].to_numpy(dtype=np.float64)
+        values_short = short_df['value'].to_numpy(dtype=np.float64)
+        spread_current = values_long[-1] - values_short[-1]
 
-            spreads['10y3m'] = {
-                'current': round(spread_current, 2),
-                '1m_ago': round(spread_1m, 2) if spread_1m is not None else None,
-                '3m_ago': round(spread_3m, 2) if spread_3m is not None else None,
-                '6m_ago': round(spread_6m, 2) if spread_6m is not None else None,
-                '1y_ago': round(spread_1y, 2) if spread_1y is not None else None,
-                'change_1m': round(change_1m, 2) if change_1m is not None else None,
-                'change_3m': round(change_3m, 2) if change_3m is not None else None,
-                'change_6m': round(change_6m, 2) if change_6m is not None else None,
-                'change_1y': round(change_1y, 2) if change_1y is not None else None,
-                'trend': trend,
-            }
+        spreads_then = _historical_spreads(
+            long_df['date'].to_numpy(), values_long,
+            short_df['date'].to_numpy(), values_short,
+            np.array(_SPREAD_LOOKBACK_DAYS)
+        )
+        changes = spread_current - spreads_then
 
-        # 30Y-5Y spread
-        if not yields_30y.empty and not yields_5y.empty:
-            current_30y = yields_30y.iloc[-1]['value']
-            current_5y = yields_5y.iloc[-1]['value']
-            spread_current = current_30y - current_5y
-
-            spread_1m = get_historical_spread(yields_30y, yields_5y, 30)
-            spread_3m = get_historical_spread(yields_30y, yields_5y, 90)
-            spread_6m = get_historical_spread(yields_30y, yields_5y, 180)
-            spread_1y = get_historical_spread(yields_30y, yields_5y, 365)
-
-            change_1m = (spread_current - spread_1m) if spread_1m is not None else None
-            change_3m = (spread_current - spread_3m) if spread_3m is not None else None
-            change_6m = (spread_current - spread_6m) if spread_6m is not None else None
-            change_1y = (spread_current - spread_1y) if spread_1y is not None else None
-
-            trend = None
-            if change_3m is not None:
-                if change_3m > 0.05:
-                    trend = 'EXPANDING'
-                elif change_3m < -0.05:
-                    trend = 'CONTRACTING'
-                else:
-                    trend = 'STABLE'
+        # Round everything in one pass; NaN marks a lookback without data
+        rounded = np.round(np.concatenate(([spread_current], spreads_then, changes)), 2)
+        summary = dict(zip(_SPREAD_SUMMARY_KEYS,
+                           [None if np.isnan(v) else v for v in rounded.tolist()]))
 
-            spreads['30y5y'] = {
-                'current': round(spread_current, 2),
-                '1m_ago': round(spread_1m, 2) if spread_1m is not None else None,
-                '3m_ago': round(spread_3m, 2) if spread_3m is not None else None,
-                '6m_ago': round(spread_6m, 2) if spread_6m is not None else None,
-                '1y_ago': round(spread_1y, 2) if spread_1y is not None else None,
-                'change_1m': round(change_1m, 2) if change_1m is not None else None,
-                'change_3m': round(change_3m, 2) if change_3m is not None else None,
-                'change_6m': round(change_6m, 2) if change_6m is not None else None,
-                'change_1y': round(change_1y, 2) if change_1y is not None else None,
-                'trend': trend,
-            }
+        # Determine trend (expanding = widening, contracting = narrowing)
+        trend = None
+        change_3m = changes[1]
+        if not np.isnan(change_3m):
+            if change_3m > trend_threshold:
+                trend = 'EXPANDING'
+            elif change_3m < -trend_threshold:
+                trend = 'CONTRACTING'
+            else:
+                trend = 'STABLE'
 
-        return spreads
+        summary['trend'] = trend
+        return summary
 
     def get_spread_history(self, lookback_days: int = 365, sample_interval: int = None) -> Dict:
         """
@@ -905,13 +1385,11 @@ class MacroDataFetcher:
             else:
                 sample_interval = 7  # Weekly for longer periods
 
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
-        yields_10y = self._fetch_series(self.TREASURY_SERIES['10Y'], start_date=start_date)
-        yields_2y = self._fetch_series(self.TREASURY_SERIES['2Y'], start_date=start_date)
-        yields_3m = self._fetch_series(self.TREASURY_SERIES['3M'], start_date=start_date)
-        yields_30y = self._fetch_series(self.TREASURY_SERIES['30Y'], start_date=start_date)
-        yields_5y = self._fetch_series(self.TREASURY_SERIES['5Y'], start_date=start_date)
+        maturities = ['10Y', '2Y', '3M', '30Y', '5Y']
+        frames = self.fetch_many([self.TREASURY_SERIES[maturity] for maturity in maturities],
+                                 start_date=start_date)
 
         history = {
             'dates': [],
@@ -920,48 +1398,43 @@ class MacroDataFetcher:
             '30y5y': []
         }
 
-        # Merge all dataframes on date to ensure consistent timeline
-        if not yields_10y.empty and not yields_2y.empty:
-            merged = pd.merge(yields_10y, yields_2y, on='date', suffixes=('_10y', '_2y'))
-
-            # Sample data at specified interval
-            sampled = merged.iloc[::sample_interval].copy()
-
-            for _, row in sampled.iterrows():
-                date_str = row['date'].strftime('%Y-%m-%d')
-                if date_str not in history['dates']:
-                    history['dates'].append(date_str)
-
-                spread_10y2y = row['value_10y'] - row['value_2y']
-                history['10y2y'].append(round(spread_10y2y, 2))
-
-        # 10Y-3M spread
-        if not yields_10y.empty and not yields_3m.empty:
-            merged = pd.merge(yields_10y, yields_3m, on='date', suffixes=('_10y', '_3m'))
-            sampled = merged.iloc[::sample_interval].copy()
-
-            # Reset if we're starting fresh
-            if not history['dates']:
-                for _, row in sampled.iterrows():
-                    history['dates'].append(row['date'].strftime('%Y-%m-%d'))
-
-            for _, row in sampled.iterrows():
-                spread_10y3m = row['value_10y'] - row['value_3m']
-                history['10y3m'].append(round(spread_10y3m, 2))
-
-        # 30Y-5Y spread
-        if not yields_30y.empty and not yields_5y.empty:
-            merged = pd.merge(yields_30y, yields_5y, on='date', suffixes=('_30y', '_5y'))
-            sampled = merged.iloc[::sample_interval].copy()
+        # One wide frame of all yields on the union of their dates (NaN where a
+        # series has no observation)
+        yields = {
+            maturity: frames[self.TREASURY_SERIES[maturity]].set_index('date')['value']
+            for maturity in maturities
+            if not frames[self.TREASURY_SERIES[maturity]].empty
+        }
+        if not yields:
+            return history
 
-            # Reset if we're starting fresh
-            if not history['dates']:
-                for _, row in sampled.iterrows():
-                    history['dates'].append(row['date'].strftime('%Y-%m-%d'))
+        wide = pd.concat(yields, axis=1).sort_index()
 
-            for _, row in sampled.iterrows():
-                spread_30y5y = row['value_30y'] - row['value_5y']
-                history['30y5y'].append(round(spread_30y5y, 2))
+        pairs = [
+            (key, wide[long_maturity].to_numpy() - wide[short_maturity].to_numpy())
+            for key, long_maturity, short_maturity in [
+                ('10y2y', '10Y', '2Y'),
+                ('10y3m', '10Y', '3M'),
+                ('30y5y', '30Y', '5Y'),
+            ]
+            if long_maturity in wide and short_maturity in wide
+        ]
+        if not pairs:
+            return history
+
+        # All spreads share one sampled set of dates (those where any spread is
+        # available) so the series stay aligned with the chart labels; a spread
+        # missing on a date is None (a gap in the chart)
+        available = np.column_stack([~np.isnan(spread) for _, spread in pairs])
+        rows = np.flatnonzero(available.any(axis=1))[::sample_interval]
+        history['dates'] = _to_date_strs(wide.index.to_numpy()[rows])
+
+        for (key, spread), has_value in zip(pairs, available[rows].T):
+            values = np.round(spread[rows], 2).tolist()
+            if has_value.all():
+                history[key] = values
+            elif has_value.any():
+                history[key] = [v if ok else None for v, ok in zip(values, has_value)]
 
         return history
 
@@ -973,18 +1446,20 @@ class MacroDataFetcher:
             Dict with current spreads and percentile rankings
         """
         lookback_days = 3650  # 10 years for percentile calc
+        start_date = self._start_date(lookback_days)
 
         spreads = {}
 
+        frames = self.fetch_many(list(self.CREDIT_SPREAD_SERIES.values()), start_date=start_date)
+
         for spread_type, series_id in self.CREDIT_SPREAD_SERIES.items():
-            df = self._fetch_series(series_id,
-                                   start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d'))
+            df = frames[series_id]
 
             if not df.empty:
-                current_value = df.iloc[-1]['value']
+                current_value = df['value'].iat[-1]
 
                 # Calculate percentile
-                percentile = (df['value'] <= current_value).sum() / len(df) * 100
+                percentile = _percentile_rank(df['value'], current_value)
 
                 spreads[spread_type] = {
                     'current': round(current_value, 0),
@@ -1008,10 +1483,10 @@ class MacroDataFetcher:
         Returns:
             Last update date as string or None
         """
-        df = self._fetch_series(series_id, start_date=(datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d'))
+        df = self._fetch_series(series_id, start_date=self._start_date(30))
 
         if not df.empty:
-            return df.iloc[-1]['date'].strftime('%Y-%m-%d')
+            return df['date'].iat[-1].strftime('%Y-%m-%d')
         return None
 
     # =========================================================================
@@ -1039,12 +1514,11 @@ class MacroDataFetcher:
             Dict with current value, historical series, percentile, and interpretation
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         try:
             # Fetch Wilshire 5000 from Yahoo Finance (FRED removed this data in June 2024)
-            wilshire = yf.Ticker("^W5000")
-            wilshire_df = wilshire.history(period=f"{lookback_years}y", interval="1mo")
+            wilshire_df = self._fetch_yahoo_monthly("^W5000", lookback_years)
 
             if wilshire_df.empty:
                 logger.warning("Could not fetch Wilshire 5000 data from Yahoo Finance")
@@ -1055,10 +1529,8 @@ class MacroDataFetcher:
                 }
 
             # Process Wilshire data - use Close prices
-            wilshire_df = wilshire_df.reset_index()
-            wilshire_df = wilshire_df[['Date', 'Close']].copy()
-            wilshire_df.columns = ['date', 'wilshire']
-            wilshire_df['date'] = pd.to_datetime(wilshire_df['date']).dt.tz_localize(None)
+            wilshire_dates = wilshire_df['date'].to_numpy().astype('datetime64[ns]')
+            wilshire_values = wilshire_df['value'].to_numpy()
 
             # Fetch GDP from FRED (quarterly, in billions)
             gdp_df = self._fetch_series(
@@ -1074,16 +1546,13 @@ class MacroDataFetcher:
                     'history': {'dates': [], 'values': []}
                 }
 
-            # Forward-fill GDP to monthly frequency to match Wilshire
-            gdp_df = gdp_df.set_index('date')
-            gdp_monthly = gdp_df.reindex(wilshire_df['date'], method='ffill').reset_index()
-            gdp_monthly.columns = ['date', 'gdp']
-
-            # Merge datasets
-            merged = pd.merge(wilshire_df, gdp_monthly, on='date', how='inner')
-            merged = merged.dropna()
+            # Forward-fill GDP to monthly frequency to match Wilshire: latest
+            # GDP print on or before each Wilshire date
+            gdp_dates = gdp_df['date'].to_numpy().astype('datetime64[ns]')
+            gdp_idx = np.searchsorted(gdp_dates, wilshire_dates, side='right') - 1
+            valid = (gdp_idx >= 0) & ~np.isnan(wilshire_values)
 
-            if merged.empty:
+            if not valid.any():
                 logger.warning("No overlapping data between Wilshire and GDP")
                 return {
                     'current': None,
@@ -1094,18 +1563,19 @@ class MacroDataFetcher:
             # Calculate Buffett Indicator
             # Wilshire 5000 index value ≈ total market cap in billions (roughly 1:1)
             # GDP is in billions, so ratio * 100 gives percentage
-            merged['buffett'] = (merged['wilshire'] / merged['gdp']) * 100
+            gdp_values = gdp_df['value'].to_numpy(dtype=np.float64)
+            buffett = wilshire_values[valid] / gdp_values[gdp_idx[valid]] * 100
 
             # Get current value
-            current_value = merged.iloc[-1]['buffett']
+            current_value = buffett[-1]
 
             # Calculate percentile
-            percentile = (merged['buffett'] <= current_value).sum() / len(merged) * 100
+            percentile = _percentile_rank(buffett, current_value)
 
             # Prepare history for charting
             history = {
-                'dates': merged['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': merged['buffett'].round(1).tolist()
+                'dates': _to_date_strs(wilshire_dates[valid]),
+                'values': np.round(buffett, 1).tolist()
             }
 
             return {
@@ -1137,7 +1607,7 @@ class MacroDataFetcher:
             Dict with current value, historical series, and year-over-year change
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         # Fetch M2 Money Supply (monthly, in billions)
         m2_df = self._fetch_series(
@@ -1159,34 +1629,31 @@ class MacroDataFetcher:
                 'history': {'dates': [], 'values': []}
             }
 
-        # Forward-fill GDP to monthly frequency
-        gdp_df = gdp_df.set_index('date')
-        gdp_monthly = gdp_df.reindex(m2_df['date']).ffill().reset_index()
-        gdp_monthly.columns = ['date', 'gdp']
+        # Forward-fill GDP to monthly frequency, aligned row for row with m2_df
+        gdp_monthly = gdp_df.set_index('date')['value'].reindex(m2_df['date']).ffill()
 
-        # Merge and calculate ratio
-        merged = pd.merge(m2_df, gdp_monthly, on='date')
-        merged['ratio'] = (merged['value'] / merged['gdp']) * 100
+        # Calculate ratio on the aligned arrays (no copy of m2_df)
+        ratio = (m2_df['value'].to_numpy() / gdp_monthly.to_numpy()) * 100
 
         # Get current value
-        current_value = merged.iloc[-1]['ratio'] if not merged.empty else None
+        current_value = ratio[-1]
 
         # Calculate YoY change
         yoy_change = None
-        if len(merged) > 12:
-            year_ago_value = merged.iloc[-13]['ratio'] if len(merged) >= 13 else None
+        if len(ratio) >= 13:
+            year_ago_value = ratio[-13]
             if year_ago_value:
                 yoy_change = current_value - year_ago_value
 
         # Prepare history for charting
         history = {
-            'dates': merged['date'].dt.strftime('%Y-%m-%d').tolist(),
-            'values': merged['ratio'].round(1).tolist()
+            'dates': _to_date_strs(m2_df['date']),
+            'values': np.round(ratio, 1).tolist()
         }
 
         return {
-            'current': round(current_value, 1) if current_value else None,
-            'yoy_change': round(yoy_change, 1) if yoy_change else None,
+            'current': round(current_value, 1) if current_value is not None else None,
+            'yoy_change': round(yoy_change, 1) if yoy_change is not None else None,
             'history': history
         }
 
@@ -1204,7 +1671,7 @@ class MacroDataFetcher:
             Dict with current value, historical series, and key historical comparisons
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         # Fetch total public debt as % of GDP (already calculated by FRED)
         debt_df = self._fetch_series(
@@ -1221,24 +1688,24 @@ class MacroDataFetcher:
             }
 
         # Get current value
-        current_value = debt_df.iloc[-1]['value'] if not debt_df.empty else None
-
-        # Historical comparisons
+        current_value = debt_df['value'].iat[-1] if not debt_df.empty else None
+
+        # Historical comparisons: last observation on or before each target date
+        now = self._current_time()
+        years_back = (5, 10, 20)
+        targets = np.array([now - timedelta(days=years * 365) for years in years_back],
+                           dtype='datetime64[ns]')
+        past_idx = np.searchsorted(debt_df['date'].to_numpy(), targets, side='right') - 1
         historical_comparison = {}
-        for years_back, label in [(5, '5y_ago'), (10, '10y_ago'), (20, '20y_ago')]:
-            target_date = datetime.now() - timedelta(days=years_back * 365)
-            past_data = debt_df[debt_df['date'] <= target_date]
-            if not past_data.empty:
-                historical_comparison[label] = round(past_data.iloc[-1]['value'], 1)
+        for years, idx in zip(years_back, past_idx):
+            if idx >= 0:
+                historical_comparison[f'{years}y_ago'] = round(debt_df['value'].iat[idx], 1)
 
         # Prepare history for charting
-        history = {
-            'dates': debt_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-            'values': debt_df['value'].round(1).tolist()
-        }
+        history = _history_dict(debt_df, 1)
 
         return {
-            'current': round(current_value, 1) if current_value else None,
+            'current': round(current_value, 1) if current_value is not None else None,
             'history': history,
             'historical_comparison': historical_comparison
         }
@@ -1258,7 +1725,7 @@ class MacroDataFetcher:
             Dict with current value, historical series, and trend
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         # Fetch M2 Velocity (already calculated by FRED as GDP/M2)
         velocity_df = self._fetch_series(
@@ -1275,21 +1742,18 @@ class MacroDataFetcher:
             }
 
         # Get current value
-        current_value = velocity_df.iloc[-1]['value'] if not velocity_df.empty else None
+        current_value = velocity_df['value'].iat[-1] if not velocity_df.empty else None
 
         # Calculate historical average
         historical_avg = velocity_df['value'].mean() if not velocity_df.empty else None
 
         # Prepare history for charting
-        history = {
-            'dates': velocity_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-            'values': velocity_df['value'].round(2).tolist()
-        }
+        history = _history_dict(velocity_df, 2)
 
         return {
-            'current': round(current_value, 2) if current_value else None,
+            'current': round(current_value, 2) if current_value is not None else None,
             'history': history,
-            'historical_avg': round(historical_avg, 2) if historical_avg else None
+            'historical_avg': round(historical_avg, 2) if historical_avg is not None else None
         }
 
     # =========================================================================
@@ -1310,54 +1774,25 @@ class MacroDataFetcher:
             Dict with national and 20-city indices, historical series, and YoY change
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
-        # Fetch national index
-        national_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['case_shiller_national'],
-            start_date=start_date
-        )
-
-        # Fetch 20-city composite
-        city20_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['case_shiller_20city'],
-            start_date=start_date
-        )
+        # Fetch national index and 20-city composite
+        series = {
+            'national': self.REAL_ESTATE_SERIES['case_shiller_national'],
+            'city20': self.REAL_ESTATE_SERIES['case_shiller_20city'],
+        }
+        frames = self.fetch_many(list(series.values()), start_date=start_date)
 
         result = {
-            'national': {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}},
-            'city20': {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}}
+            key: {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}}
+            for key in series
         }
 
-        # Process national index
-        if not national_df.empty:
-            current = national_df.iloc[-1]['value']
-            result['national']['current'] = round(current, 1)
-
-            # YoY change
-            if len(national_df) >= 13:
-                year_ago = national_df.iloc[-13]['value']
-                result['national']['yoy_change'] = round(((current - year_ago) / year_ago) * 100, 1)
-
-            result['national']['history'] = {
-                'dates': national_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': national_df['value'].round(1).tolist()
-            }
-
-        # Process 20-city index
-        if not city20_df.empty:
-            current = city20_df.iloc[-1]['value']
-            result['city20']['current'] = round(current, 1)
-
-            # YoY change
-            if len(city20_df) >= 13:
-                year_ago = city20_df.iloc[-13]['value']
-                result['city20']['yoy_change'] = round(((current - year_ago) / year_ago) * 100, 1)
-
-            result['city20']['history'] = {
-                'dates': city20_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': city20_df['value'].round(1).tolist()
-            }
+        # Latest index level, YoY change and history for each index
+        for key, series_id in series.items():
+            df = frames[series_id]
+            if not df.empty:
+                result[key] = _latest_with_yoy(df, 1)
 
         return result
 
@@ -1372,25 +1807,17 @@ class MacroDataFetcher:
             Dict with inventory, months supply, and trends
         """
         lookback_days = 10 * 365  # 10 years
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
-        # Fetch months supply of existing homes
-        months_supply_df = self._fetch_series(
+        # Fetch months supply of existing homes, housing inventory and new home months supply
+        frames = self.fetch_many([
             self.REAL_ESTATE_SERIES['months_supply'],
-            start_date=start_date
-        )
-
-        # Fetch housing inventory
-        inventory_df = self._fetch_series(
             self.REAL_ESTATE_SERIES['housing_inventory'],
-            start_date=start_date
-        )
-
-        # Fetch new home months supply
-        new_months_df = self._fetch_series(
             self.REAL_ESTATE_SERIES['new_home_months_supply'],
-            start_date=start_date
-        )
+        ], start_date=start_date)
+        months_supply_df = frames[self.REAL_ESTATE_SERIES['months_supply']]
+        inventory_df = frames[self.REAL_ESTATE_SERIES['housing_inventory']]
+        new_months_df = frames[self.REAL_ESTATE_SERIES['new_home_months_supply']]
 
         result = {
             'existing_months_supply': None,
@@ -1402,24 +1829,18 @@ class MacroDataFetcher:
 
         # Use existing home months supply for current value if available
         if not months_supply_df.empty:
-            result['existing_months_supply'] = round(months_supply_df.iloc[-1]['value'], 1)
+            result['existing_months_supply'] = round(months_supply_df['value'].iat[-1], 1)
 
         if not inventory_df.empty:
             # Inventory is in thousands
-            result['inventory'] = round(inventory_df.iloc[-1]['value'], 0)
-            result['inventory_history'] = {
-                'dates': inventory_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': inventory_df['value'].round(0).tolist()
-            }
+            result['inventory'] = round(inventory_df['value'].iat[-1], 0)
+            result['inventory_history'] = _history_dict(inventory_df, 0)
 
         if not new_months_df.empty:
-            result['new_home_months_supply'] = round(new_months_df.iloc[-1]['value'], 1)
+            result['new_home_months_supply'] = round(new_months_df['value'].iat[-1], 1)
             # Use new home months supply for chart since it has full historical data
             # NAR existing home data is limited to 13 months on FRED
-            result['months_supply_history'] = {
-                'dates': new_months_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': new_months_df['value'].round(1).tolist()
-            }
+            result['months_supply_history'] = _history_dict(new_months_df, 1)
 
         return result
 
@@ -1437,73 +1858,26 @@ class MacroDataFetcher:
             Dict with current values and historical series
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
-
-        # Fetch housing starts (thousands of units, SAAR)
-        starts_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['housing_starts'],
-            start_date=start_date
-        )
+        start_date = self._start_date(lookback_days)
 
-        # Fetch building permits
-        permits_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['building_permits'],
-            start_date=start_date
-        )
-
-        # Fetch existing home sales
-        sales_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['existing_home_sales'],
-            start_date=start_date
-        )
+        # Fetch housing starts (thousands of units, SAAR), building permits and existing home sales
+        series = {
+            'housing_starts': self.REAL_ESTATE_SERIES['housing_starts'],
+            'building_permits': self.REAL_ESTATE_SERIES['building_permits'],
+            'existing_sales': self.REAL_ESTATE_SERIES['existing_home_sales'],
+        }
+        frames = self.fetch_many(list(series.values()), start_date=start_date)
 
         result = {
-            'housing_starts': {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}},
-            'building_permits': {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}},
-            'existing_sales': {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}}
+            key: {'current': None, 'yoy_change': None, 'history': {'dates': [], 'values': []}}
+            for key in series
         }
 
-        # Process housing starts
-        if not starts_df.empty:
-            current = starts_df.iloc[-1]['value']
-            result['housing_starts']['current'] = round(current, 0)
-
-            if len(starts_df) >= 13:
-                year_ago = starts_df.iloc[-13]['value']
-                result['housing_starts']['yoy_change'] = round(((current - year_ago) / year_ago) * 100, 1)
-
-            result['housing_starts']['history'] = {
-                'dates': starts_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': starts_df['value'].round(0).tolist()
-            }
-
-        # Process building permits
-        if not permits_df.empty:
-            current = permits_df.iloc[-1]['value']
-            result['building_permits']['current'] = round(current, 0)
-
-            if len(permits_df) >= 13:
-                year_ago = permits_df.iloc[-13]['value']
-                result['building_permits']['yoy_change'] = round(((current - year_ago) / year_ago) * 100, 1)
-
-            result['building_permits']['history'] = {
-                'dates': permits_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': permits_df['value'].round(0).tolist()
-            }
-
-        # Process existing home sales
-        if not sales_df.empty:
-            current = sales_df.iloc[-1]['value']
-            result['existing_sales']['current'] = round(current, 0)
-
-            if len(sales_df) >= 13:
-                year_ago = sales_df.iloc[-13]['value']
-                result['existing_sales']['yoy_change'] = round(((current - year_ago) / year_ago) * 100, 1)
-
-            result['existing_sales']['history'] = {
-                'dates': sales_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': sales_df['value'].round(0).tolist()
-            }
+        # Latest value, YoY change and history for each series
+        for key, series_id in series.items():
+            df = frames[series_id]
+            if not df.empty:
+                result[key] = _latest_with_yoy(df, 0)
 
         return result
 
@@ -1520,7 +1894,7 @@ class MacroDataFetcher:
             Dict with current rate, historical series, and comparisons
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         mortgage_df = self._fetch_series(
             self.REAL_ESTATE_SERIES['mortgage_30y'],
@@ -1535,25 +1909,23 @@ class MacroDataFetcher:
                 'yoy_change': None
             }
 
-        current = mortgage_df.iloc[-1]['value']
+        values = mortgage_df['value'].to_numpy()
+        current = values[-1]
 
         # Calculate YoY change
         yoy_change = None
         if len(mortgage_df) >= 53:  # Weekly data
-            year_ago = mortgage_df.iloc[-53]['value']
+            year_ago = values[-53]
             yoy_change = current - year_ago
 
         # Historical average
-        historical_avg = mortgage_df['value'].mean()
+        historical_avg = values.mean()
 
         return {
             'current': round(current, 2),
-            'history': {
-                'dates': mortgage_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': mortgage_df['value'].round(2).tolist()
-            },
+            'history': _history_dict(mortgage_df, 2),
             'historical_avg': round(historical_avg, 2),
-            'yoy_change': round(yoy_change, 2) if yoy_change else None
+            'yoy_change': round(yoy_change, 2) if yoy_change is not None else None
         }
 
     def fetch_housing_affordability(self, lookback_years: int = 15) -> Dict:
@@ -1571,7 +1943,7 @@ class MacroDataFetcher:
             Dict with current value, historical series, and interpretation
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         affordability_df = self._fetch_series(
             self.REAL_ESTATE_SERIES['affordability_index'],
@@ -1586,20 +1958,18 @@ class MacroDataFetcher:
                 'percentile': None
             }
 
-        current = affordability_df.iloc[-1]['value']
+        values = affordability_df['value'].to_numpy()
+        current = values[-1]
 
         # Historical average
-        historical_avg = affordability_df['value'].mean()
+        historical_avg = values.mean()
 
         # Percentile (lower percentile = less affordable historically)
-        percentile = (affordability_df['value'] >= current).sum() / len(affordability_df) * 100
+        percentile = np.mean(values >= current) * 100
 
         return {
             'current': round(current, 1),
-            'history': {
-                'dates': affordability_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': affordability_df['value'].round(1).tolist()
-            },
+            'history': _history_dict(affordability_df, 1),
             'historical_avg': round(historical_avg, 1),
             'percentile': round(percentile, 1)
         }
@@ -1615,7 +1985,7 @@ class MacroDataFetcher:
             Dict with current price, historical series, and YoY change
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         price_df = self._fetch_series(
             self.REAL_ESTATE_SERIES['median_home_price'],
@@ -1629,21 +1999,19 @@ class MacroDataFetcher:
                 'yoy_change': None
             }
 
-        current = price_df.iloc[-1]['value']
+        values = price_df['value'].to_numpy()
+        current = values[-1]
 
         # YoY change (quarterly data)
         yoy_change = None
         if len(price_df) >= 5:
-            year_ago = price_df.iloc[-5]['value']
+            year_ago = values[-5]
             yoy_change = ((current - year_ago) / year_ago) * 100
 
         return {
             'current': round(current, 0),
-            'history': {
-                'dates': price_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': price_df['value'].round(0).tolist()
-            },
-            'yoy_change': round(yoy_change, 1) if yoy_change else None
+            'history': _history_dict(price_df, 0),
+            'yoy_change': round(yoy_change, 1) if yoy_change is not None else None
         }
 
     def fetch_mortgage_debt_service(self, lookback_years: int = 20) -> Dict:
@@ -1660,7 +2028,7 @@ class MacroDataFetcher:
             Dict with current value, historical series, and comparisons
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         mdsp_df = self._fetch_series(
             self.REAL_ESTATE_SERIES['mortgage_debt_service'],
@@ -1677,19 +2045,17 @@ class MacroDataFetcher:
                 'historical_low': None
             }
 
-        current = mdsp_df.iloc[-1]['value']
+        values = mdsp_df['value'].to_numpy()
+        current = values[-1]
 
         # Historical stats
-        historical_avg = mdsp_df['value'].mean()
-        historical_high = mdsp_df['value'].max()
-        historical_low = mdsp_df['value'].min()
+        historical_avg = values.mean()
+        historical_high = values.max()
+        historical_low = values.min()
 
         return {
             'current': round(current, 2),
-            'history': {
-                'dates': mdsp_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': mdsp_df['value'].round(2).tolist()
-            },
+            'history': _history_dict(mdsp_df, 2),
             'historical_avg': round(historical_avg, 2),
             'historical_high': round(historical_high, 2),
             'historical_low': round(historical_low, 2)
@@ -1711,19 +2077,14 @@ class MacroDataFetcher:
             Dict with current ratio, historical series, and comparisons
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
-        # Fetch median home price (quarterly)
-        price_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['median_home_price'],
-            start_date=start_date
-        )
-
-        # Fetch median household income (annual)
-        income_df = self._fetch_series(
-            self.REAL_ESTATE_SERIES['median_income'],
-            start_date=start_date
-        )
+        # Fetch median home price (quarterly) and median household income (annual)
+        price_id = self.REAL_ESTATE_SERIES['median_home_price']
+        income_id = self.REAL_ESTATE_SERIES['median_income']
+        frames = self.fetch_many([price_id, income_id], start_date=start_date)
+        price_df = frames[price_id]
+        income_df = frames[income_id]
 
         if price_df.empty or income_df.empty:
             logger.warning("Could not fetch Price-to-Income ratio data")
@@ -1734,34 +2095,34 @@ class MacroDataFetcher:
             }
 
         # Convert price to annual (use Q4 of each year for consistency)
-        price_df['year'] = price_df['date'].dt.year
-        annual_prices = price_df.groupby('year')['value'].last().reset_index()
-        annual_prices.columns = ['year', 'price']
+        annual_prices = _last_per_year(price_df, 'price')
 
         # Prepare income data
-        income_df['year'] = income_df['date'].dt.year
-        income_annual = income_df[['year', 'value']].copy()
-        income_annual.columns = ['year', 'income']
+        income_annual = _last_per_year(income_df, 'income')
 
-        # Merge and calculate ratio
-        merged = pd.merge(annual_prices, income_annual, on='year')
-        merged['ratio'] = merged['price'] / merged['income']
+        # Align the two sorted, one-row-per-year series on their common years
+        years, price_idx, income_idx = np.intersect1d(
+            annual_prices['year'].to_numpy(), income_annual['year'].to_numpy(),
+            assume_unique=True, return_indices=True
+        )
 
-        if merged.empty:
+        if len(years) == 0:
             return {
                 'current': None,
                 'history': {'dates': [], 'values': []},
                 'historical_avg': None
             }
 
-        current = merged.iloc[-1]['ratio']
-        historical_avg = merged['ratio'].mean()
+        ratio = (annual_prices['price'].to_numpy()[price_idx]
+                 / income_annual['income'].to_numpy()[income_idx])
+        current = ratio[-1]
+        historical_avg = ratio.mean()
 
         return {
             'current': round(current, 2),
             'history': {
-                'dates': [f"{int(y)}-01-01" for y in merged['year'].tolist()],
-                'values': merged['ratio'].round(2).tolist()
+                'dates': [f"{y}-01-01" for y in years.tolist()],
+                'values': np.round(ratio, 2).tolist()
             },
             'historical_avg': round(historical_avg, 2)
         }
@@ -1784,8 +2145,9 @@ class MacroDataFetcher:
         if df.empty or len(df) < periods_back + 1:
             return None
 
-        current = df.iloc[-1]['value']
-        year_ago = df.iloc[-(periods_back + 1)]['value']
+        values = df['value'].to_numpy()
+        current = values[-1]
+        year_ago = values[-(periods_back + 1)]
 
         if year_ago == 0 or pd.isna(year_ago):
             return None
@@ -1806,7 +2168,7 @@ class MacroDataFetcher:
             Dict with current inflation rates, historical series, and trends
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         result = {
             'cpi': {'current': None, 'previous': None, 'history': {'dates': [], 'values': []}},
@@ -1815,32 +2177,30 @@ class MacroDataFetcher:
             'core_pce': {'current': None, 'previous': None, 'history': {'dates': [], 'values': []}},
         }
 
-        # Fetch each inflation series
-        for metric in ['cpi', 'core_cpi', 'pce', 'core_pce']:
-            df = self._fetch_series(
-                self.INFLATION_SERIES[metric],
-                start_date=start_date
-            )
+        # Fetch all inflation series concurrently
+        metrics = ['cpi', 'core_cpi', 'pce', 'core_pce']
+        frames = self.fetch_many([self.INFLATION_SERIES[metric] for metric in metrics],
+                                 start_date=start_date)
 
-            if df.empty:
+        for metric in metrics:
+            df = frames[self.INFLATION_SERIES[metric]]
+
+            if len(df) <= 12:
                 continue
 
-            # Calculate YoY inflation rate for each data point
-            df_copy = df.copy()
-            df_copy['yoy'] = df_copy['value'].pct_change(periods=12) * 100
+            # Calculate YoY inflation rate for each data point (from the 13th month on)
+            yoy = _yoy_pct(df['value'].to_numpy())
 
             # Get current and previous month YoY
-            valid_yoy = df_copy.dropna(subset=['yoy'])
-            if not valid_yoy.empty:
-                result[metric]['current'] = round(valid_yoy.iloc[-1]['yoy'], 2)
-                if len(valid_yoy) >= 2:
-                    result[metric]['previous'] = round(valid_yoy.iloc[-2]['yoy'], 2)
-
-                # Historical YoY rates for charting
-                result[metric]['history'] = {
-                    'dates': valid_yoy['date'].dt.strftime('%Y-%m-%d').tolist(),
-                    'values': valid_yoy['yoy'].round(2).tolist()
-                }
+            result[metric]['current'] = round(yoy[-1], 2)
+            if len(yoy) >= 2:
+                result[metric]['previous'] = round(yoy[-2], 2)
+
+            # Historical YoY rates for charting
+            result[metric]['history'] = {
+                'dates': _to_date_strs(df['date'].to_numpy()[12:]),
+                'values': np.round(yoy, 2).tolist()
+            }
 
         return result
 
@@ -1858,36 +2218,21 @@ class MacroDataFetcher:
             Dict with 5Y and 10Y breakeven rates and history
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
-        result = {
-            '5y': {'current': None, 'history': {'dates': [], 'values': []}},
-            '10y': {'current': None, 'history': {'dates': [], 'values': []}},
+        series = {
+            '5y': self.INFLATION_SERIES['breakeven_5y'],
+            '10y': self.INFLATION_SERIES['breakeven_10y'],
         }
+        frames = self.fetch_many(list(series.values()), start_date=start_date)
 
-        # Fetch 5Y breakeven
-        be5_df = self._fetch_series(
-            self.INFLATION_SERIES['breakeven_5y'],
-            start_date=start_date
-        )
-        if not be5_df.empty:
-            result['5y']['current'] = round(be5_df.iloc[-1]['value'], 2)
-            result['5y']['history'] = {
-                'dates': be5_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': be5_df['value'].round(2).tolist()
-            }
+        result = {key: {'current': None, 'history': {'dates': [], 'values': []}} for key in series}
 
-        # Fetch 10Y breakeven
-        be10_df = self._fetch_series(
-            self.INFLATION_SERIES['breakeven_10y'],
-            start_date=start_date
-        )
-        if not be10_df.empty:
-            result['10y']['current'] = round(be10_df.iloc[-1]['value'], 2)
-            result['10y']['history'] = {
-                'dates': be10_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': be10_df['value'].round(2).tolist()
-            }
+        for key, series_id in series.items():
+            df = frames[series_id]
+            if not df.empty:
+                result[key]['current'] = round(df['value'].iat[-1], 2)
+                result[key]['history'] = _history_dict(df, 2)
 
         return result
 
@@ -1902,7 +2247,7 @@ class MacroDataFetcher:
             Dict with current rate and historical series
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         df = self._fetch_series(
             self.INFLATION_SERIES['fed_funds'],
@@ -1916,20 +2261,18 @@ class MacroDataFetcher:
                 'yoy_change': None
             }
 
-        current = df.iloc[-1]['value']
+        values = df['value'].to_numpy()
+        current = values[-1]
 
         # YoY change (look back ~252 trading days)
         yoy_change = None
         if len(df) >= 253:
-            year_ago = df.iloc[-253]['value']
+            year_ago = values[-253]
             yoy_change = current - year_ago
 
         return {
             'current': round(current, 2),
-            'history': {
-                'dates': df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': df['value'].round(2).tolist()
-            },
+            'history': _history_dict(df, 2),
             'yoy_change': round(yoy_change, 2) if yoy_change is not None else None
         }
 
@@ -1947,7 +2290,7 @@ class MacroDataFetcher:
             Dict with current size, YoY change, and historical series
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
 
         df = self._fetch_series(
             self.INFLATION_SERIES['fed_assets'],
@@ -1963,14 +2306,15 @@ class MacroDataFetcher:
                 'trend': None
             }
 
-        current = df.iloc[-1]['value']  # In millions
+        values = df['value'].to_numpy()
+        current = values[-1]  # In millions
         current_trillions = current / 1_000_000  # Convert to trillions
 
         # YoY change (weekly data, ~52 weeks back)
         yoy_change_pct = None
         trend = None
         if len(df) >= 53:
-            year_ago = df.iloc[-53]['value']
+            year_ago = values[-53]
             if year_ago > 0:
                 yoy_change_pct = ((current - year_ago) / year_ago) * 100
                 if yoy_change_pct > 5:
@@ -1980,16 +2324,14 @@ class MacroDataFetcher:
                 else:
                     trend = 'STABLE'
 
-        # Sample weekly data to reduce chart points
-        sampled = df.iloc[::4].copy()  # Every 4th point (~monthly)
-
         return {
             'current': round(current, 0),
             'current_trillions': round(current_trillions, 2),
             'yoy_change_pct': round(yoy_change_pct, 1) if yoy_change_pct is not None else None,
+            # Sample weekly data every 4th point (~monthly) to reduce chart points
             'history': {
-                'dates': sampled['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': (sampled['value'] / 1_000_000).round(2).tolist()  # In trillions
+                'dates': _to_date_strs(df['date'].to_numpy()[::4]),
+                'values': np.round(values[::4] / 1_000_000, 2).tolist()  # In trillions
             },
             'trend': trend
         }
@@ -2008,80 +2350,52 @@ class MacroDataFetcher:
             Dict with current real rate, historical series, and interpretation
         """
         lookback_days = lookback_years * 365
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self._start_date(lookback_days)
+
+        # Fetch Fed Funds rate and Core PCE index (for YoY calculation)
+        fed_id = self.INFLATION_SERIES['fed_funds']
+        pce_id = self.INFLATION_SERIES['core_pce']
+        frames = self.fetch_many([fed_id, pce_id], start_date=start_date)
+        fed_df = frames[fed_id]
+        pce_df = frames[pce_id]
+
+        empty_result = {
+            'current': None,
+            'fed_funds': None,
+            'core_pce': None,
+            'history': {'dates': [], 'values': []},
+        }
 
-        # Fetch Fed Funds rate
-        fed_df = self._fetch_series(
-            self.INFLATION_SERIES['fed_funds'],
-            start_date=start_date
-        )
+        if fed_df.empty or len(pce_df) <= 12:
+            return empty_result
 
-        # Fetch Core PCE index for YoY calculation
-        pce_df = self._fetch_series(
-            self.INFLATION_SERIES['core_pce'],
-            start_date=start_date
-        )
+        # Calculate Core PCE YoY (monthly, from the 13th observation on)
+        pce_yoy = _yoy_pct(pce_df['value'].to_numpy())
+        months = pce_df['date'].to_numpy()[12:].astype('datetime64[M]')
 
-        if fed_df.empty or pce_df.empty:
-            return {
-                'current': None,
-                'fed_funds': None,
-                'core_pce': None,
-                'history': {'dates': [], 'values': []},
-            }
+        # Align daily Fed Funds with monthly PCE: last Fed Funds observation
+        # of each PCE month (before the next month starts, and within the month)
+        fed_dates = fed_df['date'].to_numpy()
+        month_starts = months.astype(fed_dates.dtype)
+        next_month_starts = (months + 1).astype(fed_dates.dtype)
+        fed_idx = np.searchsorted(fed_dates, next_month_starts, side='left') - 1
+        valid = (fed_idx >= 0) & (fed_dates[np.maximum(fed_idx, 0)] >= month_starts)
 
-        # Calculate Core PCE YoY
-        pce_df_copy = pce_df.copy()
-        pce_df_copy['yoy'] = pce_df_copy['value'].pct_change(periods=12) * 100
-
-        # Merge on date (need to align monthly PCE with daily Fed Funds)
-        # Use month-end for Fed Funds to match PCE
-        fed_df['month'] = fed_df['date'].dt.to_period('M')
-        fed_monthly = fed_df.groupby('month').last().reset_index()
-        fed_monthly['date'] = fed_monthly['month'].dt.to_timestamp()
-
-        pce_df_copy['month'] = pce_df_copy['date'].dt.to_period('M')
-        pce_monthly = pce_df_copy.groupby('month').last().reset_index()
-        pce_monthly['date'] = pce_monthly['month'].dt.to_timestamp()
-
-        merged = pd.merge(
-            fed_monthly[['date', 'value']],
-            pce_monthly[['date', 'yoy']],
-            on='date',
-            suffixes=('_fed', '_pce')
-        )
-
-        if merged.empty:
-            return {
-                'current': None,
-                'fed_funds': None,
-                'core_pce': None,
-                'history': {'dates': [], 'values': []},
-            }
+        if not valid.any():
+            return empty_result
 
         # Calculate real rate
-        merged['real_rate'] = merged['value'] - merged['yoy']
-        merged = merged.dropna()
-
-        if merged.empty:
-            return {
-                'current': None,
-                'fed_funds': None,
-                'core_pce': None,
-                'history': {'dates': [], 'values': []},
-            }
-
-        current_real = merged.iloc[-1]['real_rate']
-        current_fed = merged.iloc[-1]['value']
-        current_pce = merged.iloc[-1]['yoy']
+        fed_rates = fed_df['value'].to_numpy()[fed_idx[valid]]
+        pce_yoy = pce_yoy[valid]
+        real_rates = fed_rates - pce_yoy
 
         return {
-            'current': round(current_real, 2),
-            'fed_funds': round(current_fed, 2),
-            'core_pce': round(current_pce, 2),
+            'current': round(real_rates[-1], 2),
+            'fed_funds': round(fed_rates[-1], 2),
+            'core_pce': round(pce_yoy[-1], 2),
             'history': {
-                'dates': merged['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': merged['real_rate'].round(2).tolist()
+                'dates': _to_date_strs(months[valid]),
+                'values': np.round(real_rates, 2).tolist()
             },
         }
 
@@ -2089,7 +2403,8 @@ class MacroDataFetcher:
     # MARKET SENTIMENT INDICATORS
     # =========================================================================
 
-    def fetch_vix_data(self, lookback_years: int = 5, use_cache: bool = True) -> Dict:
+    def fetch_vix_data(self, lookback_years: int = 5, use_cache: bool = True,
+                       include_history: bool = True) -> Dict:
         """
         Fetch VIX and VIX3M data from Yahoo Finance
 
@@ -2101,12 +2416,13 @@ class MacroDataFetcher:
         Args:
             lookback_years: Years of history to fetch
             use_cache: Whether to use database cache
+            include_history: Whether to build the chart histories (left empty
+                otherwise, e.g. when only current levels are needed)
 
         Returns:
             Dict with VIX data, term structure, and historical series
         """
         lookback_days = lookback_years * 365
-        start_date_str = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
 
         result = {
             'vix': {'current': None, 'percentile': None, 'history': {'dates': [], 'values': []}},
@@ -2115,32 +2431,33 @@ class MacroDataFetcher:
             'term_structure_status': None,
         }
 
+        # Download both tickers in one request; the calls below read them from cache
+        if use_cache:
+            self.prefetch_yahoo_series(['^VIX', '^VIX3M'], lookback_days)
+
         # Fetch VIX
         vix_df = self._fetch_vix_ticker('^VIX', lookback_days, use_cache)
         if not vix_df.empty:
-            current_vix = vix_df.iloc[-1]['value']
+            vix_values = vix_df['value'].to_numpy()
+            current_vix = vix_values[-1]
             result['vix']['current'] = round(current_vix, 2)
 
             # Calculate percentile over lookback period
-            percentile = (vix_df['value'] <= current_vix).sum() / len(vix_df) * 100
+            percentile = _percentile_rank(vix_values, current_vix)
             result['vix']['percentile'] = round(percentile, 1)
 
-            result['vix']['history'] = {
-                'dates': vix_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': vix_df['value'].round(2).tolist()
-            }
+            if include_history:
+                result['vix']['history'] = _history_dict(vix_df, 2)
 
         # Fetch VIX3M
         vix3m_df = self._fetch_vix_ticker('^VIX3M', lookback_days, use_cache)
         if not vix3m_df.empty:
-            result['vix3m']['current'] = round(vix3m_df.iloc[-1]['value'], 2)
-            result['vix3m']['history'] = {
-                'dates': vix3m_df['date'].dt.strftime('%Y-%m-%d').tolist(),
-                'values': vix3m_df['value'].round(2).tolist()
-            }
+            result['vix3m']['current'] = round(vix3m_df['value'].iat[-1], 2)
+            if include_history:
+                result['vix3m']['history'] = _history_dict(vix3m_df, 2)
 
         # Calculate term structure
-        if result['vix']['current'] and result['vix3m']['current']:
+        if result['vix']['current'] is not None and result['vix3m']['current'] is not None:
             term_structure = result['vix3m']['current'] - result['vix']['current']
             result['term_structure'] = round(term_structure, 2)
 
@@ -2165,59 +2482,7 @@ class MacroDataFetcher:
         Returns:
             DataFrame with date and value columns
         """
-        start_date_str = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
-
-        # Try cache first
-        if use_cache and self.db:
-            try:
-                cached_df = self.db.get_macro_data('vix', ticker, start_date=start_date_str)
-                if not cached_df.empty:
-                    latest_date = pd.to_datetime(cached_df['date'].max())
-                    cache_age = datetime.now() - latest_date.replace(tzinfo=None)
-                    if cache_age.total_seconds() / 3600 <= self.cache_hours:
-                        logger.info(f"Using cached {ticker} data (age: {cache_age.total_seconds()/3600:.1f}h)")
-                        return cached_df
-            except Exception as e:
-                logger.error(f"Error reading {ticker} cache: {e}")
-
-        # Fetch from Yahoo Finance
-        try:
-            vix = yf.Ticker(ticker)
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=lookback_days)
-
-            hist = vix.history(start=start_date, end=end_date)
-
-            if hist.empty:
-                logger.warning(f"No {ticker} data available from Yahoo Finance")
-                return pd.DataFrame(columns=['date', 'value'])
-
-            df = pd.DataFrame({
-                'date': hist.index,
-                'value': hist['Close']
-            })
-            df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
-            df = df.sort_values('date').reset_index(drop=True)
-
-            logger.info(f"Fetched {len(df)} {ticker} observations from Yahoo Finance")
-
-            # Save to cache
-            if use_cache and self.db:
-                try:
-                    observations = [
-                        {'date': row['date'].strftime('%Y-%m-%d'), 'value': row['value']}
-                        for _, row in df.iterrows()
-                    ]
-                    self.db.save_macro_data('vix', ticker, observations)
-                    logger.info(f"Saved {ticker} data to cache")
-                except Exception as e:
-                    logger.error(f"Error saving {ticker} cache: {e}")
-
-            return df
-
-        except Exception as e:
-            logger.error(f"Error fetching {ticker} from Yahoo Finance: {e}")
-            return pd.DataFrame(columns=['date', 'value'])
+        return self._fetch_yahoo_series(ticker, lookback_days, use_cache)
 
     def fetch_sp500_moving_averages(self, use_cache: bool = True) -> Dict:
         """
@@ -2231,46 +2496,10 @@ class MacroDataFetcher:
         Returns:
             Dict with current price, MAs, and position relative to MAs
         """
-        # Get S&P 500 data (reuse existing method logic)
-        series_id = '^GSPC'
-        lookback_days = 400  # Need ~1 year for 200-day MA
-
-        # Try cache first
-        df = None
-        if use_cache and self.db:
-            try:
-                cached_df = self.db.get_macro_data('sp500', series_id)
-                if not cached_df.empty:
-                    latest_date = pd.to_datetime(cached_df['date'].max())
-                    cache_age = datetime.now() - latest_date.replace(tzinfo=None)
-                    if cache_age.total_seconds() / 3600 <= self.cache_hours:
-                        df = cached_df
-            except Exception:
-                pass
-
-        if df is None:
-            try:
-                sp500 = yf.Ticker(series_id)
-                hist = sp500.history(period="2y")
-                if not hist.empty:
-                    df = pd.DataFrame({
-                        'date': hist.index,
-                        'value': hist['Close']
-                    })
-                    df['date'] = pd.to_datetime(df['date']).dt.tz_localize(None)
-                    df = df.sort_values('date').reset_index(drop=True)
-            except Exception as e:
-                logger.error(f"Error fetching S&P 500: {e}")
-                return {
-                    'current': None,
-                    'ma_50': None,
-                    'ma_200': None,
-                    'above_50': None,
-                    'above_200': None,
-                    'trend': None
-                }
+        # Get S&P 500 data, ~1 year of trading days is needed for the 200-day MA
+        df = self._fetch_yahoo_series('^GSPC', 730, use_cache)
 
-        if df is None or df.empty or len(df) < 200:
+        if df.empty or len(df) < 200:
             return {
                 'current': None,
                 'ma_50': None,
@@ -2280,10 +2509,12 @@ class MacroDataFetcher:
                 'trend': None
             }
 
-        # Calculate MAs
-        current = df.iloc[-1]['value']
-        ma_50 = df['value'].tail(50).mean()
-        ma_200 = df['value'].tail(200).mean()
+        # Calculate MAs; the 50-day window is the tail of the 200-day one
+        # (nanmean skips missing closes like the pandas reductions did)
+        last_200 = df['value'].to_numpy()[-200:]
+        current = last_200[-1]
+        ma_50 = np.nanmean(last_200[-50:])
+        ma_200 = np.nanmean(last_200)
 
         above_50 = current > ma_50
         above_200 = current > ma_200
@@ -2320,10 +2551,21 @@ class MacroDataFetcher:
         """
         components = {}
 
+        # The three inputs are independent network/cache lookups: run them
+        # concurrently. Pin the reference time first so every worker derives
+        # the same lookback windows (and memory cache keys) from it.
+        self._current_time()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            vix_future = executor.submit(self.fetch_vix_data, lookback_years=1, include_history=False)
+            credit_future = executor.submit(self.fetch_credit_spreads)
+            ma_future = executor.submit(self.fetch_sp500_moving_averages)
+            vix_data = vix_future.result()
+            credit_data = credit_future.result()
+            ma_data = ma_future.result()
+
         # 1. VIX Level Score (0-100)
         # VIX 10 = 100 (extreme greed), VIX 40 = 0 (extreme fear)
-        vix_data = self.fetch_vix_data(lookback_years=1)
-        if vix_data['vix']['current']:
+        if vix_data['vix']['current'] is not None:
             vix = vix_data['vix']['current']
             # Scale: 10 → 100, 25 → 50, 40 → 0
             vix_score = max(0, min(100, 100 - ((vix - 10) / 30) * 100))
@@ -2346,8 +2588,7 @@ class MacroDataFetcher:
             }
 
         # 3. Credit Spreads Score
-        credit_data = self.fetch_credit_spreads()
-        if credit_data.get('high_yield', {}).get('percentile'):
+        if credit_data.get('high_yield', {}).get('percentile') is not None:
             # Low percentile = tight spreads = greed
             # High percentile = wide spreads = fear
             percentile = credit_data['high_yield']['percentile']
@@ -2360,8 +2601,8 @@ class MacroDataFetcher:
             }
 
         # 4. S&P 500 vs 200-day MA
-        ma_data = self.fetch_sp500_moving_averages()
-        if ma_data['current'] and ma_data['ma_200']:
+        # The 200-day MA is the divisor below, so it must also be positive
+        if ma_data['current'] is not None and ma_data['ma_200'] is not None and ma_data['ma_200'] > 0:
             # Calculate % above/below 200-day MA
             pct_vs_ma = ((ma_data['current'] - ma_data['ma_200']) / ma_data['ma_200']) * 100
             # +10% above = 100 (greed), at MA = 50, -10% below = 0 (fear)
@@ -2392,7 +2633,61 @@ class MacroDataFetcher:
                 status = 'EXTREME FEAR'
 
         return {
-            'overall': round(overall, 1) if overall else None,
+            'overall': round(overall, 1) if overall is not None else None,
             'status': status,
             'components': components
         }
+
+
+# =============================================================================
+# CACHE CLASSIFICATION
+# =============================================================================
+
+# Reverse lookup of series_id -> data_type used to key the macro_data cache.
+# Series missing from this map are never cached in the database. Built once at
+# import; membership tests go through this dict rather than scanning the
+# *_SERIES.values() views.
+_SERIES_TO_TYPE: Dict[str, str] = {
+    series_id: data_type
+    for data_type, series_ids in [
+        ('fx_rate', MacroDataFetcher.CURRENCY_SERIES.values()),
+        ('yield', MacroDataFetcher.TREASURY_SERIES.values()),
+        ('credit_spread', MacroDataFetcher.CREDIT_SPREAD_SERIES.values()),
+        ('gold', ['GC=F']),
+        ('buffett_indicator', [MacroDataFetcher.GLOBAL_ECONOMY_SERIES['buffett_indicator']]),
+        ('gdp', [MacroDataFetcher.GLOBAL_ECONOMY_SERIES['gdp']]),
+        ('money_supply', [MacroDataFetcher.GLOBAL_ECONOMY_SERIES['m2'],
+                          MacroDataFetcher.GLOBAL_ECONOMY_SERIES['m2_velocity']]),
+        ('debt', [MacroDataFetcher.GLOBAL_ECONOMY_SERIES['debt_gdp'],
+                  MacroDataFetcher.GLOBAL_ECONOMY_SERIES['debt_public_gdp']]),
+        ('housing_price', [MacroDataFetcher.REAL_ESTATE_SERIES['case_shiller_national'],
+                           MacroDataFetcher.REAL_ESTATE_SERIES['case_shiller_20city'],
+                           MacroDataFetcher.REAL_ESTATE_SERIES['median_home_price']]),
+        ('housing_activity', [MacroDataFetcher.REAL_ESTATE_SERIES['housing_starts'],
+                              MacroDataFetcher.REAL_ESTATE_SERIES['building_permits'],
+                              MacroDataFetcher.REAL_ESTATE_SERIES['existing_home_sales']]),
+        ('housing_inventory', [MacroDataFetcher.REAL_ESTATE_SERIES['housing_inventory'],
+                               MacroDataFetcher.REAL_ESTATE_SERIES['months_supply'],
+                               MacroDataFetcher.REAL_ESTATE_SERIES['new_home_months_supply']]),
+        ('mortgage', [MacroDataFetcher.REAL_ESTATE_SERIES['mortgage_30y']]),
+        ('affordability', [MacroDataFetcher.REAL_ESTATE_SERIES['affordability_index'],
+                           MacroDataFetcher.REAL_ESTATE_SERIES['median_income'],
+                           MacroDataFetcher.REAL_ESTATE_SERIES['mortgage_debt_service']]),
+        ('inflation', [MacroDataFetcher.INFLATION_SERIES['cpi'],
+                       MacroDataFetcher.INFLATION_SERIES['core_cpi'],
+                       MacroDataFetcher.INFLATION_SERIES['pce'],
+                       MacroDataFetcher.INFLATION_SERIES['core_pce']]),
+        ('breakeven', [MacroDataFetcher.INFLATION_SERIES['breakeven_5y'],
+                       MacroDataFetcher.INFLATION_SERIES['breakeven_10y']]),
+        ('fed_funds', [MacroDataFetcher.INFLATION_SERIES['fed_funds']]),
+        ('fed_assets', [MacroDataFetcher.INFLATION_SERIES['fed_assets']]),
+        ('vix', ['^VIX', '^VIX3M']),
+        ('sp500', ['^GSPC']),
+    ]
+    for series_id in series_ids
+}
+
+
+def _series_to_data_type(series_id: str) -> Optional[str]:
+    """Return the cache data_type for a series, or None if it is not cached"""
+    return _SERIES_TO_TYPE.get(series_id)
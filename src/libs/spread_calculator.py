@@ -6,9 +6,9 @@ Handles calculation of yield curve spreads and credit spreads
 with historical context and trend analysis.
 """
 
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class SpreadCalculator:
@@ -28,28 +28,31 @@ class SpreadCalculator:
         """
         self.fetcher = data_fetcher
 
-    def _get_historical_spread(self, df1: pd.DataFrame, df2: pd.DataFrame, days_back: int) -> Optional[float]:
+    def _get_historical_spreads(self, df1: pd.DataFrame, df2: pd.DataFrame,
+                                days_back: List[int]) -> List[Optional[float]]:
         """
-        Get spread value from days_back ago.
+        Get spread values from several lookbacks ago in one pass.
 
         Args:
-            df1: DataFrame with date and value for first yield
-            df2: DataFrame with date and value for second yield
-            days_back: Number of days to look back
+            df1: DataFrame with date and value for first yield, sorted by date
+            df2: DataFrame with date and value for second yield, sorted by date
+            days_back: Numbers of days to look back
 
         Returns:
-            Spread value or None if data not available
+            Spread values in the order of days_back (None where data is not available)
         """
         if df1.empty or df2.empty:
-            return None
+            return [None] * len(days_back)
 
-        target_date = df1.iloc[-1]['date'] - timedelta(days=days_back)
-        hist_df1 = df1[df1['date'] <= target_date]
-        hist_df2 = df2[df2['date'] <= target_date]
+        dates1 = df1['date'].to_numpy()
+        dates2 = df2['date'].to_numpy()
+        targets = dates1[-1] - np.array(days_back, dtype='timedelta64[D]')
+        idx1 = np.searchsorted(dates1, targets, side='right') - 1
+        idx2 = np.searchsorted(dates2, targets, side='right') - 1
 
-        if not hist_df1.empty and not hist_df2.empty:
-            return hist_df1.iloc[-1]['value'] - hist_df2.iloc[-1]['value']
-        return None
+        spreads = df1['value'].to_numpy()[idx1] - df2['value'].to_numpy()[idx2]
+        return [spread if i1 >= 0 and i2 >= 0 else None
+                for spread, i1, i2 in zip(spreads, idx1, idx2)]
 
     def _calculate_single_spread(self, df_long: pd.DataFrame, df_short: pd.DataFrame,
                                   trend_threshold: float = 0.1) -> Optional[Dict]:
@@ -67,15 +70,14 @@ class SpreadCalculator:
         if df_long.empty or df_short.empty:
             return None
 
-        current_long = df_long.iloc[-1]['value']
-        current_short = df_short.iloc[-1]['value']
+        current_long = df_long['value'].iat[-1]
+        current_short = df_short['value'].iat[-1]
         spread_current = current_long - current_short
 
         # Historical spreads at different lookbacks
-        spread_1m = self._get_historical_spread(df_long, df_short, 30)
-        spread_3m = self._get_historical_spread(df_long, df_short, 90)
-        spread_6m = self._get_historical_spread(df_long, df_short, 180)
-        spread_1y = self._get_historical_spread(df_long, df_short, 365)
+        spread_1m, spread_3m, spread_6m, spread_1y = self._get_historical_spreads(
+            df_long, df_short, [30, 90, 180, 365]
+        )
 
         # Calculate changes
         change_1m = (spread_current - spread_1m) if spread_1m is not None else None
@@ -106,6 +108,21 @@ class SpreadCalculator:
             'trend': trend,
         }
 
+    def _fetch_yields(self, maturities: List[str], start_date: str) -> List[pd.DataFrame]:
+        """
+        Fetch several Treasury yield series concurrently.
+
+        Args:
+            maturities: Maturity labels (e.g. ['10Y', '2Y'])
+            start_date: Start date in YYYY-MM-DD format
+
+        Returns:
+            DataFrames with date and value columns, in the order of maturities
+        """
+        series_ids = [self.fetcher.TREASURY_SERIES[maturity] for maturity in maturities]
+        frames = self.fetcher.fetch_many(series_ids, start_date=start_date)
+        return [frames[series_id] for series_id in series_ids]
+
     def calculate_yield_spreads(self) -> Dict:
         """
         Calculate key yield spreads with historical context and trend analysis.
@@ -119,19 +136,11 @@ class SpreadCalculator:
             Dict with spread calculations, historical values, and trend indicators
         """
         lookback_days = 1095  # 3 years for context
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        start_date = self.fetcher._start_date(lookback_days)
 
         # Fetch required yield data
-        yields_10y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['10Y'], start_date=start_date)
-        yields_2y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['2Y'], start_date=start_date)
-        yields_3m = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['3M'], start_date=start_date)
-        yields_30y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['30Y'], start_date=start_date)
-        yields_5y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['5Y'], start_date=start_date)
+        yields_10y, yields_2y, yields_3m, yields_30y, yields_5y = self._fetch_yields(
+            ['10Y', '2Y', '3M', '30Y', '5Y'], start_date)
 
         spreads = {}
 
@@ -156,69 +165,16 @@ class SpreadCalculator:
         """
         Get historical spread data for charting.
 
+        Uses the fetcher's implementation without sampling, so all spreads
+        share one date axis (None where a pair has no data on a date).
+
         Args:
             lookback_days: Days of history to fetch (default 1 year)
 
         Returns:
             Dict with dates and spread values for each spread type
         """
-        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
-
-        yields_10y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['10Y'], start_date=start_date)
-        yields_2y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['2Y'], start_date=start_date)
-        yields_3m = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['3M'], start_date=start_date)
-        yields_30y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['30Y'], start_date=start_date)
-        yields_5y = self.fetcher._fetch_series(
-            self.fetcher.TREASURY_SERIES['5Y'], start_date=start_date)
-
-        history = {
-            'dates': [],
-            '10y2y': [],
-            '10y3m': [],
-            '30y5y': []
-        }
-
-        # 10Y-2Y spread history
-        if not yields_10y.empty and not yields_2y.empty:
-            merged = pd.merge(yields_10y, yields_2y, on='date', suffixes=('_10y', '_2y'))
-
-            for _, row in merged.iterrows():
-                date_str = row['date'].strftime('%Y-%m-%d')
-                if date_str not in history['dates']:
-                    history['dates'].append(date_str)
-
-                spread = row['value_10y'] - row['value_2y']
-                history['10y2y'].append(round(spread, 2))
-
-        # 10Y-3M spread history
-        if not yields_10y.empty and not yields_3m.empty:
-            merged = pd.merge(yields_10y, yields_3m, on='date', suffixes=('_10y', '_3m'))
-
-            if not history['dates']:
-                for _, row in merged.iterrows():
-                    history['dates'].append(row['date'].strftime('%Y-%m-%d'))
-
-            for _, row in merged.iterrows():
-                spread = row['value_10y'] - row['value_3m']
-                history['10y3m'].append(round(spread, 2))
-
-        # 30Y-5Y spread history
-        if not yields_30y.empty and not yields_5y.empty:
-            merged = pd.merge(yields_30y, yields_5y, on='date', suffixes=('_30y', '_5y'))
-
-            if not history['dates']:
-                for _, row in merged.iterrows():
-                    history['dates'].append(row['date'].strftime('%Y-%m-%d'))
-
-            for _, row in merged.iterrows():
-                spread = row['value_30y'] - row['value_5y']
-                history['30y5y'].append(round(spread, 2))
-
-        return history
+        return self.fetcher.get_spread_history(lookback_days, sample_interval=1)
 
     def calculate_credit_spreads(self) -> Dict:
         """
@@ -234,14 +190,14 @@ class SpreadCalculator:
 
         spreads = {}
 
+        frames = self.fetcher.fetch_many(list(self.fetcher.CREDIT_SPREAD_SERIES.values()),
+                                         start_date=self.fetcher._start_date(lookback_days))
+
         for spread_type, series_id in self.fetcher.CREDIT_SPREAD_SERIES.items():
-            df = self.fetcher._fetch_series(
-                series_id,
-                start_date=(datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
-            )
+            df = frames[series_id]
 
             if not df.empty:
-                current_value = df.iloc[-1]['value']
+                current_value = df['value'].iat[-1]
 
                 # Calculate percentile (what percentage of historical values are below current)
                 percentile = (df['value'] <= current_value).sum() / len(df) * 100
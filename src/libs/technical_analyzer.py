@@ -176,8 +176,8 @@ class TechnicalAnalyzer:
             'target_90d': round(target_90d, 2),
             'upside_30d_percent': round(((target_30d - current_price) / current_price) * 100, 2),
             'upside_90d_percent': round(((target_90d - current_price) / current_price) * 100, 2),
-            'ma_20': round(ma_20, 2) if ma_20 else None,
-            'ma_50': round(ma_50, 2) if ma_50 else None,
+            'ma_20': round(ma_20, 2) if ma_20 is not None else None,
+            'ma_50': round(ma_50, 2) if ma_50 is not None else None,
             'p_value': round(p_value, 4)
         }
 
@@ -267,7 +267,7 @@ class TechnicalAnalyzer:
             return {'labels': [], 'datasets': []}
 
         # Prepare price data
-        labels = self.df['date'].dt.strftime('%Y-%m-%d').tolist()
+        labels = np.datetime_as_string(self.df['date'].to_numpy().astype('datetime64[D]'), unit='D').tolist()
         close_prices = self.df['close'].tolist()
 
         datasets = [
@@ -7,12 +7,15 @@ that are used across all routes.
 
 import os
 import sys
+import threading
+import time
 
 # Add parent directory to path to import libs
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from libs.stock_fetcher import StockFetcher
 from libs.database import StockDatabase
+from libs.macro_fetcher import MacroDataFetcher
 
 # Get absolute path to data directory (project root / data / stocks.db)
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -35,3 +38,27 @@ def init_fred_api_key():
 def get_fred_api_key():
     """Get the FRED API key"""
     return _fred_api_key
+
+
+# Shared macro fetcher: its memory cache and HTTP session outlive a single
+# request, so navigating between macro pages does not re-read every series
+# from the database. After a few minutes it is replaced by a fresh instance
+# rather than cleared, so requests in flight keep the cache and reference
+# clock they started with.
+MACRO_FETCHER_TTL_SECONDS = 300
+
+_macro_fetcher = None
+_macro_fetcher_created = 0.0
+_macro_fetcher_lock = threading.Lock()
+
+
+def get_macro_fetcher(fred_api_key: str) -> MacroDataFetcher:
+    """Get the shared macro fetcher, replacing it once it is older than the TTL"""
+    global _macro_fetcher, _macro_fetcher_created
+    with _macro_fetcher_lock:
+        now = time.monotonic()
+        if (_macro_fetcher is None or _macro_fetcher.api_key != fred_api_key
+                or now - _macro_fetcher_created >= MACRO_FETCHER_TTL_SECONDS):
+            _macro_fetcher = MacroDataFetcher(fred_api_key, db=db, cache_hours=24)
+            _macro_fetcher_created = now
+        return _macro_fetcher
@@ -5,8 +5,7 @@ Split into: Currencies, Rates & Spreads, Global Economy, Real Estate
 
 from flask import render_template, jsonify, redirect, url_for
 from webapp.routes import macro_bp
-from webapp.extensions import db, get_fred_api_key
-from libs.macro_fetcher import MacroDataFetcher
+from webapp.extensions import get_fred_api_key, get_macro_fetcher
 from libs.macro_analyzer import MacroAnalyzer
 
 
@@ -16,7 +15,7 @@ def _get_fetcher_and_analyzer():
     if not fred_api_key:
         return None, None, "FRED API key not configured. Please add FRED_API_KEY to your .env file."
 
-    macro_fetcher = MacroDataFetcher(fred_api_key, db=db, cache_hours=24)
+    macro_fetcher = get_macro_fetcher(fred_api_key)
     analyzer = MacroAnalyzer()
     return macro_fetcher, analyzer, None
 
@@ -43,6 +42,9 @@ def macro_currencies():
         if error:
             return render_template('error.html', error=error)
 
+        # Fetch gold and S&P 500 history from Yahoo Finance in one request
+        macro_fetcher.prefetch_yahoo_series(['GC=F', '^GSPC'], lookback_days=1825)
+
         # Fetch currency and gold data
         currencies = macro_fetcher.calculate_currency_returns(base='USD')
         currencies_vs_gold = macro_fetcher.calculate_currencies_vs_gold()
@@ -50,9 +52,10 @@ def macro_currencies():
 
         # Gold returns
         gold_usd_df = macro_fetcher.fetch_gold_price(lookback_days=1825)
-        gold_returns = {}
-        for period, days in [('1d', 1), ('1w', 7), ('1m', 30), ('3m', 90), ('1y', 365), ('3y', 1095), ('5y', 1825)]:
-            gold_returns[period] = macro_fetcher._calculate_period_return(gold_usd_df, days)
+        gold_returns = macro_fetcher._calculate_series_returns(
+            gold_usd_df,
+            {'1d': 1, '1w': 7, '1m': 30, '3m': 90, '1y': 365, '3y': 1095, '5y': 1825},
+        )
 
         # Generate insights
         insights = analyzer.format_currency_comparison_insight(currencies, {'1y': gold_returns.get('1y')})
@@ -87,11 +90,12 @@ def macro_rates():
         if error:
             return render_template('error.html', error=error)
 
-        # Fetch yield curve and spreads
+        # Fetch the longest history first: the yield curve and spreads
+        # below are then sliced from the same Treasury series in memory
+        spread_history = macro_fetcher.get_spread_history(lookback_days=7300)  # 20 years
         yield_curve = macro_fetcher.fetch_yield_curve()
         spreads_raw = macro_fetcher.calculate_yield_spreads()
         spreads = analyzer.interpret_yield_curve(spreads_raw)
-        spread_history = macro_fetcher.get_spread_history(lookback_days=7300)  # 20 years
         recession_indicators = analyzer.get_recession_indicator_summary(spreads)
 
         # Credit spreads
@@ -407,6 +411,10 @@ def macro_sentiment():
         if error:
             return render_template('error.html', error=error)
 
+        # Fetch VIX and S&P 500 history from Yahoo Finance in one request; the
+        # shorter S&P 500 window used for the moving averages is sliced from it
+        macro_fetcher.prefetch_yahoo_series(['^VIX', '^VIX3M', '^GSPC'], lookback_days=1825)
+
         # Fetch sentiment data
         vix_data = macro_fetcher.fetch_vix_data(lookback_years=5)
         fear_greed = macro_fetcher.calculate_fear_greed_components()
@@ -63,7 +63,7 @@ def technical_analysis_basic():
                              error=f"Insufficient price history for {ticker} (need at least 30 days)")
 
     analyzer = TechnicalAnalyzer(price_df)
-    current_price = stock_info.get('current_price', price_df.iloc[-1]['close'])
+    current_price = stock_info.get('current_price', price_df['close'].iat[-1])
     technical_data = analyzer.calculate_all_indicators(current_price)
     chart_data = analyzer.get_chart_data(include_indicators=True)
 